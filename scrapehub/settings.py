@@ -203,3 +203,20 @@ Q_CLUSTER = {
     'django_redis': 'default',  # Use the 'default' cache defined in CACHES
     'catch_up': False,
 }
+
+# Logging: the scrapers' debug output (logger.debug) is emitted only when DEBUG is on
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'scrapers': {
+            'handlers': ['console'],
+            'level': 'DEBUG' if DEBUG else 'INFO',
+        },
+    },
+}
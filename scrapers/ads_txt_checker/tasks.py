@@ -1,8 +1,38 @@
 from scrapers.jobs.models import Job, JobEvent, JobResult
-from scrapers.ads_txt_checker.views import detect_homepage_url, check_file
+from scrapers.ads_txt_checker.views import detect_homepage_url, check_file, dedupe_key, ADS_TXT_PATH, APP_ADS_TXT_PATH
+from django.db.models import F
 from django.utils import timezone
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import time
 
+# Minimum gap (seconds) between consecutive requests to the same host
+HOST_REQUEST_DELAY = 0.5
+
+# Number of URLs checked concurrently (the work is network-bound)
+MAX_WORKERS = 16
+
+
+def _check_url(url_input, wait_for_host, detect_homepage):
+    """
+    Network part of one ads.txt check, run in a worker thread.
+    Returns plain data only; all database writes stay in the task thread.
+    """
+    homepage_url, detection_status = detect_homepage(url_input)
+    if not homepage_url:
+        return {'error': f'Homepage detection failed: {detection_status}'}
+
+    # Rate limiting: only wait if this host was hit very recently
+    # (homepage_url is always 'scheme://host/', so the host needs no re-parsing)
+    wait_for_host(homepage_url.split('/', 3)[2])
+
+    return {
+        'homepage_url': homepage_url,
+        'homepage_detection': detection_status,
+        'ads_txt_result': check_file(homepage_url + ADS_TXT_PATH),
+        'app_ads_txt_result': check_file(homepage_url + APP_ADS_TXT_PATH),
+    }
+
 
 def process_ads_txt_job(job_id, urls, start_index=0):
     """
@@ -39,104 +69,184 @@ def process_ads_txt_job(job_id, urls, start_index=0):
         # Only process the slice of URLs starting from effective_start_index
         urls_to_process = urls[effective_start_index:]
         
+        # Input URLs that already have a result for this job (e.g. on resume),
+        # loaded once so duplicate checks are set lookups rather than queries
+        seen_urls = set(JobResult.objects.filter(job=job).values_list('original_url', flat=True))
+        
+        # Next free request slot per host, so only back-to-back hits on one host are delayed.
+        # Slots are reserved under a lock because workers share the table.
+        next_host_slot = {}
+        host_lock = threading.Lock()
+        
+        def wait_for_host(host):
+            with host_lock:
+                now = time.monotonic()
+                slot = max(now, next_host_slot.get(host, 0))
+                next_host_slot[host] = slot + HOST_REQUEST_DELAY
+            if slot > now:
+                time.sleep(slot - now)
+        
+        # Homepage detection memoized per input host (same grouping as check_ads_txt,
+        # so www/apex variants share it), so many URLs on one domain cost a single lookup
+        homepage_cache = {}
+        homepage_lock = threading.Lock()
+        
+        def detect_homepage(url_input):
+            key = dedupe_key(url_input)
+            with homepage_lock:
+                if key in homepage_cache:
+                    return homepage_cache[key]
+            detected = detect_homepage_url(url_input)
+            with homepage_lock:
+                homepage_cache[key] = detected
+            return detected
+        
+        # URLs are checked by a thread pool a bounded distance ahead of the loop,
+        # but results are consumed in input order so processed_items stays a valid
+        # resume point. Duplicates are never submitted.
+        executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        futures = {}
+        submitted_urls = set(seen_urls)
+        next_submit = 0
+        
+        def submit_ahead(position):
+            nonlocal next_submit
+            limit = min(len(urls_to_process), position + MAX_WORKERS * 2)
+            while next_submit < limit:
+                url = urls_to_process[next_submit]
+                if url not in submitted_urls:
+                    submitted_urls.add(url)
+                    futures[next_submit] = executor.submit(_check_url, url, wait_for_host, detect_homepage)
+                next_submit += 1
+        
+        def cancel_pending():
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        # Progress ticks only touch the processed_items/updated_at columns
+        _update_progress = Job.objects.filter(pk=job.pk).update
+        
+        # In-loop events are buffered and written with a single bulk INSERT
+        pending_events = []
+        
+        def flush_events():
+            if pending_events:
+                JobEvent.objects.bulk_create(pending_events)
+                pending_events.clear()
+        
+        # Results and the matching statistics increments are written in batches
+        pending_results = []
+        stats_delta = dict.fromkeys(['stats_ads_success', 'stats_ads_error', 'stats_app_success', 'stats_app_error'], 0)
+        
+        def flush_results():
+            if pending_results:
+                JobResult.objects.bulk_create(pending_results, batch_size=500)
+                pending_results.clear()
+            if any(stats_delta.values()):
+                # Atomic F() increments so concurrent readers never see a lost update
+                Job.objects.filter(pk=job.pk).update(
+                    stats_last_updated=timezone.now(),
+                    **{field: F(field) + count for field, count in stats_delta.items() if count}
+                )
+                for field in stats_delta:
+                    stats_delta[field] = 0
+        
         for i, url_input in enumerate(urls_to_process):
             # Calculate actual index in the full list
             index = effective_start_index + i
-            # Check if job should pause/stop
-            job.refresh_from_db()
+            # Check if job should pause/stop. Only the status column is read,
+            # and only every 5 items, instead of reloading the full row per URL.
+            if i % 5 == 0:
+                status = Job.objects.filter(pk=job.pk).values_list('status', flat=True).first()
+                if status is None:
+                    print(f"Job {job_id} no longer exists, exiting task")
+                    cancel_pending()
+                    return {'success': False, 'error': 'Job was deleted'}
+                job.status = status
             
             # Check if job was stopped or failed
             if job.status in ['stopped', 'failed']:
                 print(f"Job {job_id} was stopped/failed, exiting task")
+                cancel_pending()
+                flush_results()
+                flush_events()
                 return {'success': False, 'error': f'Job was {job.status}'}
             
             # If job is paused, exit the task - it will be restarted on resume
             if job.status == 'paused' or job.status == 'auto_paused':
                 print(f"Job {job_id} is paused at {index}/{len(urls)}, exiting task")
-                JobEvent.objects.create(
+                cancel_pending()
+                pending_events.append(JobEvent(
                     job=job,
                     event_type='paused',
                     message=f'Job paused at {index}/{len(urls)} URLs (task will resume from this point)'
-                )
+                ))
+                flush_results()
+                flush_events()
                 # Save current progress and exit - resume will restart from processed_items
                 job.processed_items = index
-                job.save()
+                job.save(update_fields=['processed_items', 'updated_at'])
                 return {'success': True, 'paused': True, 'processed': index}
             
+            submit_ahead(i)
+            
             # Process URL
             try:
-                # Detect homepage
-                homepage_url, detection_status = detect_homepage_url(url_input)
-                
                 # Check for duplicates based on original input URL
-                if JobResult.objects.filter(job=job, original_url=url_input).exists():
+                if url_input in seen_urls:
                     # Duplicate input URL found - skip processing
                     # But we still count it as processed
                     job.processed_items = index + 1
                     
-                    # Update progress periodically even for duplicates
+                    # Update progress periodically even for duplicates; results are
+                    # written first so processed_items never runs ahead of them
                     if (index + 1) % 50 == 0:
-                        job.save()
-                    
-                    # Special check to ensure we save if we are at the end of a block
-                    if (index + 1) % 10 == 0: 
-                        job.save()
+                        flush_results()
+                        job.save(update_fields=['processed_items', 'updated_at'])
                         
                     continue
 
+                seen_urls.add(url_input)
+                
+                # Wait for the worker result (re-raises any worker exception)
+                outcome = futures.pop(i).result()
+                
                 result_entry = JobResult(
                     job=job,
                     original_url=url_input
                 )
 
-                if not homepage_url:
-                    result_entry.error = f'Homepage detection failed: {detection_status}'
-                    result_entry.save()
-                    job.processed_items = index + 1
-                    job.save()
-                    continue
-                
-                # Check ads.txt and app-ads.txt
-                ads_url = homepage_url + 'ads.txt'
-                app_ads_url = homepage_url + 'app-ads.txt'
-                
-                ads_result = check_file(ads_url)
-                app_ads_result = check_file(app_ads_url)
-                
-                result_entry.homepage_url = homepage_url
-                result_entry.homepage_detection = detection_status
-                result_entry.ads_txt_result = ads_result
-                result_entry.app_ads_txt_result = app_ads_result
-                result_entry.save()
-                
-                # Update cached statistics incrementally using F() expressions for atomic updates
-                from django.db.models import F
-                
-                # Update ads.txt statistics
-                if ads_result and ads_result.get('status_code') == 200:
-                    job.stats_ads_success = F('stats_ads_success') + 1
+                if 'error' in outcome:
+                    result_entry.error = outcome['error']
+                    pending_results.append(result_entry)
                 else:
-                    job.stats_ads_error = F('stats_ads_error') + 1
+                    ads_result = outcome['ads_txt_result']
+                    app_ads_result = outcome['app_ads_txt_result']
                 
-                # Update app-ads.txt statistics
-                if app_ads_result and app_ads_result.get('status_code') == 200:
-                    job.stats_app_success = F('stats_app_success') + 1
-                else:
-                    job.stats_app_error = F('stats_app_error') + 1
+                    result_entry.homepage_url = outcome['homepage_url']
+                    result_entry.homepage_detection = outcome['homepage_detection']
+                    result_entry.ads_txt_result = ads_result
+                    result_entry.app_ads_txt_result = app_ads_result
+                    pending_results.append(result_entry)
                 
-                job.stats_last_updated = timezone.now()
-                job.save(update_fields=['stats_ads_success', 'stats_ads_error', 'stats_app_success', 'stats_app_error', 'stats_last_updated'])
+                    # Update ads.txt statistics
+                    if ads_result and ads_result.get('status_code') == 200:
+                        stats_delta['stats_ads_success'] += 1
+                    else:
+                        stats_delta['stats_ads_error'] += 1
                 
-                # Rate limiting: small delay to avoid overwhelming servers
-                time.sleep(0.5)
+                    # Update app-ads.txt statistics
+                    if app_ads_result and app_ads_result.get('status_code') == 200:
+                        stats_delta['stats_app_success'] += 1
+                    else:
+                        stats_delta['stats_app_error'] += 1
                 
             except Exception as url_error:
                 # Log the error in results
-                JobResult.objects.create(
+                pending_results.append(JobResult(
                     job=job,
                     original_url=url_input,
                     error=str(url_error)
-                )
+                ))
                 
                 # Auto-pause on repeated errors
                 job.retry_count += 1
@@ -144,13 +254,16 @@ def process_ads_txt_job(job_id, urls, start_index=0):
                     job.status = 'auto_paused'
                     job.auto_pause_reason = f'Server error: {str(url_error)}'
                     job.processed_items = index  # Save current position
-                    job.save()
+                    cancel_pending()
+                    flush_results()
+                    job.save(update_fields=['status', 'auto_pause_reason', 'processed_items', 'retry_count', 'updated_at'])
                     
-                    JobEvent.objects.create(
+                    pending_events.append(JobEvent(
                         job=job,
                         event_type='auto_paused',
                         message=f'Auto-paused after {job.retry_count} errors at item {index + 1}/{len(urls)}: {str(url_error)}'
-                    )
+                    ))
+                    flush_events()
                     
                     # EXIT THE TASK - resume will restart from processed_items
                     print(f"Job {job_id} auto-paused at {index}/{len(urls)}, exiting task")
@@ -165,23 +278,34 @@ def process_ads_txt_job(job_id, urls, start_index=0):
             
             # Save results every 50 items to reduce DB load for large jobs
             if (index + 1) % 50 == 0:
-                job.save()
+                flush_results()
+                job.save(update_fields=['processed_items', 'updated_at'])
                 
                 # Create progress event every 10% or every 100 items, whichever is larger
                 progress_interval = max(100, len(urls) // 10)
                 if (index + 1) % progress_interval == 0:
-                    JobEvent.objects.create(
+                    pending_events.append(JobEvent(
                         job=job,
                         event_type='progress',
                         message=f'Processed {index + 1}/{len(urls)} URLs'
-                    )
-            else:
-                # Always save job progress (fast DB update)
-                job.save(update_fields=['processed_items', 'updated_at'])
+                    ))
+            elif (index + 1) % 10 == 0:
+                # Resume restarts from processed_items, so the buffered results must be
+                # written before the counter moves past them
+                flush_results()
+                # Lightweight single-row UPDATE of the progress counter
+                _update_progress(processed_items=index + 1, updated_at=timezone.now())
+            
+            if (index + 1) % 100 == 0:
+                flush_events()
+        
+        executor.shutdown()
+        flush_results()
+        flush_events()
         
         # Ensure final count is accurate
         job.processed_items = len(urls)
-        job.save()
+        job.save(update_fields=['processed_items', 'updated_at'])
 
         print(f"=== PROCESSING COMPLETE: job_id={job_id}, processed={len(urls)} ===")
         
@@ -213,10 +337,15 @@ def process_ads_txt_job(job_id, urls, start_index=0):
     except Exception as e:
         # Job failed - try to update job if it exists
         try:
+            if 'executor' in locals():
+                executor.shutdown(wait=False, cancel_futures=True)
+            if 'pending_events' in locals():
+                flush_results()
+                flush_events()
             if 'job' in locals():
                 job.status = 'failed'
                 job.error_message = str(e)
-                job.save()
+                job.save(update_fields=['status', 'error_message', 'updated_at'])
                 
                 JobEvent.objects.create(
                     job=job,
@@ -1,22 +1,241 @@
 import requests
 import urllib3
+import atexit
+import ipaddress
 import json
+import os
+import re
+import shutil
+import socket
+import ssl
+import tempfile
+import threading
 import time
-from functools import wraps
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError
+from urllib3.util.connection import allowed_gai_family
+from urllib3.util.retry import Retry
+from django.core.cache import cache
 from django.shortcuts import render
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
-from urllib.parse import urlparse, urlunparse
+from urllib.parse import urlsplit
+from django_q.tasks import async_task
+
+from scrapers.jobs.models import Job
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Static request headers, built once instead of on every fetch
+HOMEPAGE_HEADERS = {
+    'User-Agent': USER_AGENT,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+FILE_HEADERS = {
+    'User-Agent': USER_AGENT,
+    'Accept': 'text/plain,text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Cache-Control': 'no-cache',
+}
+
+# Files checked relative to each detected homepage
+ADS_TXT_PATH = 'ads.txt'
+APP_ADS_TXT_PATH = 'app-ads.txt'
+
+# Any HTML tag or doctype; ads.txt files never contain one, so a match means the server
+# answered with a web page. Only the start of the body is scanned.
+HTML_TAG_RE = re.compile(r'<(?:!doctype\b|/?[a-z][a-z0-9]*(?:\s[^<>]*)?/?>)', re.IGNORECASE)
+HTML_SCAN_CHARS = 4096
+
+# How long (seconds) a fetched ads.txt / app-ads.txt result is reused from the cache
+FILE_CACHE_TTL = 3600
+
+# Larger check_ads_txt batches are handed to a background job instead of
+# holding the HTTP request open (unless the caller asks for inline=true)
+INLINE_CHECK_LIMIT = 10
+
+# Maximum number of URLs checked concurrently by the check_ads_txt endpoint
+CHECK_MAX_WORKERS = 32
 
 # Suppress InsecureRequestWarning since we intentionally use verify=False for scraping
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# DNS cache for the ads.txt session: homepage, ads.txt and app-ads.txt probes hit the
+# same host, so resolve each hostname once per TTL instead of on every new connection.
+# It is wired into this module's connection pools only (see CachedDNSAdapter), never
+# into urllib3 globally, and keeps every address so connects can fall through them.
+DNS_CACHE_TTL = 300
+_dns_cache = {}
+_dns_lock = threading.Lock()
+_dns_next_purge = 0
+
+def resolve_host(host, port):
+    """
+    Return the cached list of IP addresses for host, in getaddrinfo order and limited
+    to the families urllib3 would use, or None to fall back to normal resolution
+    (IP literals, localhost, lookup failures).
+    """
+    if host == 'localhost' or host.endswith('.localhost'):
+        return None
+    try:
+        ipaddress.ip_address(host.strip('[]'))
+        return None
+    except ValueError:
+        pass
+    now = time.monotonic()
+    with _dns_lock:
+        cached = _dns_cache.get(host)
+    if cached and cached[1] > now:
+        return cached[0]
+    try:
+        infos = socket.getaddrinfo(host, port, allowed_gai_family(), socket.SOCK_STREAM)
+    except socket.gaierror:
+        return None
+    ips = list(dict.fromkeys(info[4][0] for info in infos))
+    if not ips:
+        return None
+    global _dns_next_purge
+    with _dns_lock:
+        # Drop expired entries once per TTL so the cache only holds recently seen hosts
+        if now >= _dns_next_purge:
+            for stale in [h for h, (_, expires) in _dns_cache.items() if expires <= now]:
+                del _dns_cache[stale]
+            _dns_next_purge = now + DNS_CACHE_TTL
+        _dns_cache[host] = (ips, now + DNS_CACHE_TTL)
+    return ips
+
+def evict_host(host):
+    """Forget host's cached addresses so the next connection resolves it again"""
+    with _dns_lock:
+        _dns_cache.pop(host, None)
+
+class _CachedDNSConnectionMixin:
+    """Connect to the host's cached addresses in order, like urllib3's create_connection"""
+    def _new_conn(self):
+        host = self._dns_host
+        ips = resolve_host(host, self.port)
+        if not ips:
+            return super()._new_conn()
+        last_error = None
+        try:
+            for ip in ips:
+                # TLS SNI and certificate checks use self.host, only the socket gets the IP
+                self._dns_host = ip
+                try:
+                    return super()._new_conn()
+                except ConnectTimeoutError as e:
+                    # Covers NewConnectionError too; a dead address must not stay pinned
+                    last_error = e
+                    evict_host(host)
+        finally:
+            self._dns_host = host
+        raise last_error
+
+class CachedDNSHTTPConnection(_CachedDNSConnectionMixin, urllib3.connection.HTTPConnection):
+    pass
+
+class CachedDNSHTTPSConnection(_CachedDNSConnectionMixin, urllib3.connection.HTTPSConnection):
+    pass
+
+class CachedDNSHTTPConnectionPool(urllib3.HTTPConnectionPool):
+    ConnectionCls = CachedDNSHTTPConnection
+
+class CachedDNSHTTPSConnectionPool(urllib3.HTTPSConnectionPool):
+    ConnectionCls = CachedDNSHTTPSConnection
+
+# Concurrent requests allowed to one host, so parallel workers don't trip rate limits
+# (a 429/503 sends the URL down the much slower Selenium fallback)
+MAX_CONCURRENT_PER_HOST = 2
+_host_slots = {}
+_host_slots_lock = threading.Lock()
+
+@contextmanager
+def host_slot(url):
+    """Hold one of the host's MAX_CONCURRENT_PER_HOST request slots for the duration"""
+    host = urlsplit(url).netloc.lower()
+    with _host_slots_lock:
+        entry = _host_slots.setdefault(host, [threading.Semaphore(MAX_CONCURRENT_PER_HOST), 0])
+        entry[1] += 1
+    try:
+        with entry[0]:
+            yield
+    finally:
+        # Forget hosts nobody is waiting on so the table doesn't grow with every domain seen
+        with _host_slots_lock:
+            entry[1] -= 1
+            if not entry[1]:
+                del _host_slots[host]
+
+# One TLS context shared by every HTTPS connection instead of urllib3 building a new
+# one per connection. Certificates are deliberately not verified (scraping arbitrary
+# publisher sites); requests is still passed verify=False so it doesn't re-enable checks.
+_ssl_context = ssl.create_default_context()
+_ssl_context.check_hostname = False
+_ssl_context.verify_mode = ssl.CERT_NONE
+_ssl_context.set_alpn_protocols(['http/1.1'])
+
+# One retry with backoff for connect/read failures and 429/503 answers. The final
+# response is returned rather than raised so blocked URLs still reach the Selenium
+# fallback. Retry-After is ignored: servers may ask for hours, which would stall a worker.
+FETCH_RETRY = Retry(
+    total=1,
+    connect=1,
+    read=1,
+    backoff_factor=1,
+    status_forcelist=(429, 503),
+    allowed_methods=frozenset(['GET', 'HEAD']),
+    respect_retry_after_header=False,
+    raise_on_status=False,
+)
+
+class UnverifiedTLSAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose connection pools all use the shared, preconfigured SSL context
+    and resolve hostnames through the module's DNS cache
+    """
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = _ssl_context
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': CachedDNSHTTPConnectionPool,
+            'https': CachedDNSHTTPSConnectionPool,
+        }
+
+# One requests.Session per thread: homepage, ads.txt and app-ads.txt fetches for a
+# host reuse the same keep-alive connection, and worker threads never share a Session
+_thread_local = threading.local()
+
+def get_session():
+    """Return the calling thread's requests.Session, creating it on first use"""
+    session = getattr(_thread_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        # Keep connections to many distinct hosts alive; transient failures are retried in urllib3
+        adapter = UnverifiedTLSAdapter(pool_connections=100, pool_maxsize=10, max_retries=FETCH_RETRY)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({'User-Agent': USER_AGENT})
+        _thread_local.session = session
+    return session
+
 class MockResponse:
     """Mock response object for Selenium fallback"""
     def __init__(self, content, status_code=200, url=None):
@@ -24,80 +243,141 @@ class MockResponse:
         self.status_code = status_code
         self.url = url
 
-def get_selenium_content(url):
-    """
-    Fetch content using headless Chrome via Selenium.
-    Used as fallback for 403/401 errors.
-    """
+# Headless Chrome instances are kept and reused across fallbacks, since starting
+# Chrome costs far more than loading an ads.txt page. At most SELENIUM_MAX_DRIVERS
+# exist at once; callers beyond that wait for a free one.
+SELENIUM_MAX_DRIVERS = 4
+_selenium_slots = threading.BoundedSemaphore(SELENIUM_MAX_DRIVERS)
+_selenium_lock = threading.Lock()
+_idle_drivers = []
+_all_drivers = set()
+
+# Each concurrent Chrome needs its own profile directory; slots are handed back when
+# a driver quits so a replacement reuses the previous instance's HTTP cache.
+# gunicorn and the qcluster workers run side by side (and workers are forked after
+# import), so the root is created lazily per process id and removed at exit.
+SELENIUM_PROFILE_PREFIX = 'chrome-scraper-'
+_free_profile_slots = list(range(SELENIUM_MAX_DRIVERS))
+_driver_profile_slots = {}
+_profile_root = None
+_profile_root_pid = None
+
+def _selenium_profile_root():
+    """Return this process's private profile root, creating it on first use (call with _selenium_lock held)"""
+    global _profile_root, _profile_root_pid
+    pid = os.getpid()
+    if _profile_root_pid != pid:
+        _profile_root = tempfile.mkdtemp(prefix=f'{SELENIUM_PROFILE_PREFIX}{pid}-')
+        _profile_root_pid = pid
+    return _profile_root
+
+def _create_selenium_driver():
     chrome_options = Options()
     chrome_options.add_argument("--headless")
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--disable-gpu")
     chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+    chrome_options.add_argument(f"user-agent={USER_AGENT}")
+    
+    # ads.txt checks only need the document text; skip images, CSS and fonts
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+        "profile.managed_default_content_settings.fonts": 2,
+    })
+    
+    with _selenium_lock:
+        slot = _free_profile_slots.pop()
+        profile_dir = os.path.join(_selenium_profile_root(), f'profile-{slot}')
+    chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+    chrome_options.add_argument(f"--disk-cache-dir={os.path.join(profile_dir, 'cache')}")
     
-    driver = None
     try:
         # Use system installed chromium-driver in Docker
         service = Service("/usr/bin/chromedriver")
         driver = webdriver.Chrome(service=service, options=chrome_options)
-        
         driver.set_page_load_timeout(30)
-        driver.get(url)
-        
-        # Wait a bit for JS to execute (simple wait)
-        time.sleep(2)
-        
-        content = driver.page_source
-        current_url = driver.current_url
-        
-        return MockResponse(content, 200, current_url)
-        
-    except Exception as e:
-        print(f"Selenium error for {url}: {str(e)}")
-        # If selenium fails, return a 500 equivalent
-        return MockResponse(str(e), 500, url)
-    finally:
-        if driver:
-            try:
-                driver.quit()
-            except:
-                pass
+    except Exception:
+        with _selenium_lock:
+            _free_profile_slots.append(slot)
+        raise
+    with _selenium_lock:
+        _all_drivers.add(driver)
+        _driver_profile_slots[driver] = slot
+    return driver
 
+def _quit_selenium_driver(driver):
+    with _selenium_lock:
+        _all_drivers.discard(driver)
+        slot = _driver_profile_slots.pop(driver, None)
+    try:
+        driver.quit()
+    except:
+        pass
+    if slot is not None:
+        with _selenium_lock:
+            _free_profile_slots.append(slot)
+
+@atexit.register
+def _quit_all_selenium_drivers():
+    with _selenium_lock:
+        drivers = list(_all_drivers)
+    for driver in drivers:
+        _quit_selenium_driver(driver)
+    # Only the process that created the profile root removes it
+    if _profile_root and _profile_root_pid == os.getpid():
+        shutil.rmtree(_profile_root, ignore_errors=True)
 
-def retry_with_backoff(max_retries=3, initial_delay=1, backoff_factor=2, exceptions=(requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+def get_selenium_content(url):
     """
-    Retry decorator with exponential backoff.
-    
-    Args:
-        max_retries: Maximum number of retry attempts
-        initial_delay: Initial delay in seconds
-        backoff_factor: Multiplier for delay on each retry
-        exceptions: Tuple of exceptions to catch and retry
+    Fetch content using headless Chrome via Selenium.
+    Used as fallback for 403/401 errors.
     """
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            delay = initial_delay
-            last_exception = None
+    with _selenium_slots:
+        with _selenium_lock:
+            driver = _idle_drivers.pop() if _idle_drivers else None
+        try:
+            if driver is None:
+                driver = _create_selenium_driver()
             
-            for attempt in range(max_retries + 1):
+            driver.get(url)
+            
+            # Plain-text files (the usual ads.txt case) are complete once loaded;
+            # otherwise wait for the document to finish rather than a fixed delay
+            content_type = driver.execute_script("return document.contentType") or ''
+            if not content_type.startswith('text/plain'):
                 try:
-                    return func(*args, **kwargs)
-                except exceptions as e:
-                    last_exception = e
-                    if attempt < max_retries:
-                        print(f"Attempt {attempt + 1} failed: {str(e)}. Retrying in {delay}s...")
-                        time.sleep(delay)
-                        delay *= backoff_factor
-                    else:
-                        print(f"All {max_retries + 1} attempts failed for {func.__name__}")
+                    WebDriverWait(driver, 5).until(
+                        lambda d: d.execute_script("return document.readyState") == "complete"
+                    )
+                except TimeoutException:
+                    pass
             
-            # If all retries failed, raise the last exception
-            raise last_exception
-        return wrapper
-    return decorator
+            content = driver.page_source
+            current_url = driver.current_url
+            
+            # Healthy driver goes back to the pool for the next fallback
+            with _selenium_lock:
+                _idle_drivers.append(driver)
+            
+            return MockResponse(content, 200, current_url)
+            
+        except Exception as e:
+            print(f"Selenium error for {url}: {str(e)}")
+            # A failed driver may be wedged; discard it so the next call starts fresh
+            if driver:
+                _quit_selenium_driver(driver)
+            # If selenium fails, return a 500 equivalent
+            return MockResponse(str(e), 500, url)
+
+
+def json_response(data, status=200):
+    """JsonResponse equivalent that serializes with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return HttpResponse(orjson.dumps(data), content_type='application/json', status=status)
+    return JsonResponse(data, status=status)
 
 def index(request):
     """Render the ads.txt checker interface"""
@@ -106,39 +386,31 @@ def index(request):
         'page_description': 'Enterprise-grade bulk ads.txt and app-ads.txt validation'
     })
 
-def detect_homepage_url(url_input):
-    """
-    Detect the actual homepage URL by following redirects and handling SSL/www variations.
-    Returns the final homepage URL after all redirects.
-    """
-    # Clean the input URL - remove whitespace and quotes
-    url = url_input.strip().strip('"\'')
-    if not url:
-        return None, 'Empty URL'
-    
-    # Add protocol if missing
-    if not url.startswith(('http://', 'https://')):
-        url = 'https://' + url
-
-@retry_with_backoff(max_retries=1, initial_delay=1)
 def _fetch_homepage(url):
     """Helper function to fetch homepage with retries and browser fallback"""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-    }
-    
     try:
-        response = requests.get(
-            url, 
-            timeout=10,
-            allow_redirects=True,
-            headers=headers,
-            verify=False
-        )
+        with host_slot(url):
+            # Only the final URL after redirects is needed, so try HEAD first
+            response = get_session().head(
+                url, 
+                timeout=10,
+                allow_redirects=True,
+                headers=HOMEPAGE_HEADERS,
+                verify=False
+            )
+            
+            if response.status_code >= 400:
+                # Some servers reject or mishandle HEAD (400/403/405/501); retry with a
+                # streamed GET and close it without downloading the body
+                response = get_session().get(
+                    url, 
+                    timeout=10,
+                    allow_redirects=True,
+                    headers=HOMEPAGE_HEADERS,
+                    verify=False,
+                    stream=True
+                )
+                response.close()
         
         # Check for blocking status codes
         if response.status_code in [403, 401, 429, 503]:
@@ -152,16 +424,34 @@ def _fetch_homepage(url):
         print(f"Request failed for {url}: {str(e)}. Trying Selenium fallback...")
         return get_selenium_content(url)
 
+def homepage_of(url):
+    """Return the 'scheme://host/' root of an absolute URL"""
+    # urlsplit skips the ';params' handling of urlparse, which is never needed here
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}/"
+
 def detect_homepage_url(url_input):
     """
     Detect the actual homepage URL by following redirects and handling SSL/www variations.
-    Returns the final homepage URL after all redirects.
+    Returns (homepage_url, status): the final homepage URL after all redirects, or None
+    and the reason detection failed.
+
+    An explicit https:// root URL (no path or query) is returned as-is with status
+    'OK (direct)' without any request: redirects are not resolved and reachability is
+    not checked, so an unreachable host only shows up in the ads.txt fetch results.
     """
     # Clean the input URL - remove whitespace and quotes
     url = url_input.strip().strip('"\'')
     if not url:
         return None, 'Empty URL'
     
+    # An explicit https:// root URL is already a homepage; skip the network probe and
+    # let the ads.txt fetches follow any redirects themselves
+    if url.startswith('https://'):
+        parsed = urlsplit(url)
+        if parsed.netloc and not parsed.path.strip('/') and not parsed.query:
+            return f"https://{parsed.netloc}/", 'OK (direct)'
+    
     # Add protocol if missing
     if not url.startswith(('http://', 'https://')):
         url = 'https://' + url
@@ -170,23 +460,15 @@ def detect_homepage_url(url_input):
     try:
         response = _fetch_homepage(url)
         
-        # Get the final URL after all redirects
-        final_url = response.url
-        
-        # Parse to get the base domain
-        parsed = urlparse(final_url)
-        homepage_url = f"{parsed.scheme}://{parsed.netloc}/"
-        
-        return homepage_url, 'OK'
+        # Base domain of the final URL after all redirects
+        return homepage_of(response.url), 'OK'
         
     except requests.exceptions.SSLError:
         # If HTTPS fails due to SSL, try HTTP
         try:
             http_url = url.replace('https://', 'http://')
             response = _fetch_homepage(http_url)
-            parsed = urlparse(response.url)
-            homepage_url = f"{parsed.scheme}://{parsed.netloc}/"
-            return homepage_url, 'OK (HTTP fallback)'
+            return homepage_of(response.url), 'OK (HTTP fallback)'
         except:
             return None, 'SSL Error'
     except requests.exceptions.Timeout:
@@ -197,36 +479,68 @@ def detect_homepage_url(url_input):
         return None, f'Error: {str(e)}'
 
 
-@retry_with_backoff(max_retries=1, initial_delay=0.5)
 def _fetch_file(url):
-    """Helper function to fetch file with retries and browser fallback"""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Accept': 'text/plain,text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Cache-Control': 'no-cache',
-    }
+    """
+    Helper function to fetch file with retries and browser fallback.
+    Returns (response, body) where body is the start of the body text for a 200
+    response (see read_body_head) and None otherwise.
+    """
+    with host_slot(url):
+        try:
+            # Streamed so only the start of the body is downloaded
+            response = get_session().get(
+                url, 
+                timeout=10,
+                headers=FILE_HEADERS,
+                verify=False,
+                stream=True
+            )
+        except (requests.exceptions.RequestException, Exception) as e:
+            print(f"Request failed for {url}: {str(e)}. Trying Selenium fallback...")
+            response = None
+        else:
+            if response.status_code == 200:
+                # Read while the slot is still held so the per-host cap covers the
+                # body transfer, not just the connection and headers
+                return response, read_body_head(response)
+            response.close()
 
+    # Check for blocking status codes or soft 403s
+    if response is not None:
+        if response.status_code not in [403, 401, 429, 503]:
+            return response, None
+        print(f"Got {response.status_code} for {url}, trying Selenium fallback...")
+    response = get_selenium_content(url)
+    return response, read_body_head(response) if response.status_code == 200 else None
+
+def read_body_head(response, limit=HTML_SCAN_CHARS):
+    """
+    Return roughly the first `limit` bytes of a response body as text and release the
+    connection, so a server answering with a multi-MB page is never fully downloaded.
+    """
+    if not isinstance(response, requests.Response):
+        # Selenium fallback: the page source is already in memory
+        return response.text[:limit]
     try:
-        response = requests.get(
-            url, 
-            timeout=10,
-            headers=headers,
-            verify=False
-        )
-
-        # Check for blocking status codes or soft 403s
-        if response.status_code in [403, 401, 429, 503]:
-            print(f"Got {response.status_code} for {url}, trying Selenium fallback...")
-            return get_selenium_content(url)
+        raw = response.raw.read(limit, decode_content=True)
+    finally:
+        response.close()
+    return raw.decode(response.encoding or 'utf-8', errors='replace')
 
-        return response
+def check_file(url, force_refresh=False):
+    """
+    Helper to check a specific URL for ads.txt content.
+    Definitive results (200/404) are cached for FILE_CACHE_TTL unless force_refresh is set.
+    """
+    cache_key = f'ads_txt_file_{url}'
+    if not force_refresh:
+        try:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+        except Exception as cache_err:
+            print(f"Cache read failed for {url}: {cache_err}")
     
-    except (requests.exceptions.RequestException, Exception) as e:
-        print(f"Request failed for {url}: {str(e)}. Trying Selenium fallback...")
-        return get_selenium_content(url)
-
-def check_file(url):
-    """Helper to check a specific URL for ads.txt content"""
     result = {
         'url': url,
         'status_code': None,
@@ -238,25 +552,19 @@ def check_file(url):
     
     start_time = time.time()
     try:
-        response = _fetch_file(url)
-        result['time_ms'] = int((time.time() - start_time) * 1000)
+        response, body = _fetch_file(url)
         result['status_code'] = response.status_code
         
         if response.status_code == 200:
             result['result_text'] = 'OK'
-            result['content'] = response.text[:500] + '...' if len(response.text) > 500 else response.text
+            result['content'] = body[:500] + '...' if len(body) > 500 else body
             
             # Check for HTML tags
-            if '<html' in response.text.lower() or '<body' in response.text.lower() or '<div' in response.text.lower():
+            if HTML_TAG_RE.search(body):
                 result['has_html'] = 'Yes'
-            else:
-                try:
-                    if bool(BeautifulSoup(response.text, "html.parser").find()):
-                        result['has_html'] = 'Yes'
-                except:
-                    pass
         else:
             result['result_text'] = f'HTTP {response.status_code}'
+        result['time_ms'] = int((time.time() - start_time) * 1000)
             
     except requests.exceptions.Timeout:
         result['time_ms'] = int((time.time() - start_time) * 1000)
@@ -267,9 +575,61 @@ def check_file(url):
     except Exception as e:
         result['time_ms'] = int((time.time() - start_time) * 1000)
         result['result_text'] = str(e)
+    
+    # Transient failures (timeouts, 5xx, blocks) are not cached so they are retried next time
+    if result['status_code'] in (200, 404):
+        try:
+            cache.set(cache_key, result, timeout=FILE_CACHE_TTL)
+        except Exception as cache_err:
+            print(f"Cache write failed for {url}: {cache_err}")
         
     return result
 
+def dedupe_key(url_input):
+    """
+    Key identifying inputs that resolve to the same ads.txt host:
+    scheme, path, trailing slash, case and a leading 'www.' are ignored.
+    Only used for grouping; requests still go to the original input.
+    """
+    url = url_input.strip().strip('"\'')
+    if not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
+    host = urlsplit(url).netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    return host or url_input
+
+def check_single_url(url_input, force_refresh=False):
+    """
+    Detect the homepage for one input URL and check its ads.txt and app-ads.txt.
+    homepage_detection is the detect_homepage_url status; 'OK (direct)' means the
+    input was already an https root and the homepage was not probed.
+    """
+    # Step 1-4: Clean, validate, and detect homepage URL
+    homepage_url, detection_status = detect_homepage_url(url_input)
+    
+    if not homepage_url:
+        return {
+            'original_url': url_input,
+            'error': f'Homepage detection failed: {detection_status}'
+        }
+    
+    # Step 5-6: Check ads.txt and app-ads.txt files
+    ads_url = homepage_url + ADS_TXT_PATH
+    app_ads_url = homepage_url + APP_ADS_TXT_PATH
+    
+    ads_result = check_file(ads_url, force_refresh)
+    app_ads_result = check_file(app_ads_url, force_refresh)
+    
+    # Step 7: Prepare result
+    return {
+        'original_url': url_input,
+        'homepage_url': homepage_url,
+        'homepage_detection': detection_status,
+        'ads_txt': ads_result,
+        'app_ads_txt': app_ads_result
+    }
+
 @csrf_exempt
 @require_http_methods(["POST"])
 def check_ads_txt(request):
@@ -279,53 +639,70 @@ def check_ads_txt(request):
             urls = data.get('urls', [])
             if isinstance(urls, str):
                 urls = [u.strip() for u in urls.split('\n') if u.strip()]
+            force_refresh = bool(data.get('force_refresh'))
+            inline = bool(data.get('inline'))
         else:
             urls = request.POST.getlist('urls[]')
+            force_refresh = request.POST.get('force_refresh') in ('1', 'true', 'on')
+            inline = request.POST.get('inline') in ('1', 'true', 'on')
+        force_refresh = force_refresh or request.GET.get('force_refresh') in ('1', 'true')
+        inline = inline or request.GET.get('inline') in ('1', 'true')
+        
+        if len(urls) > INLINE_CHECK_LIMIT and not inline:
+            return json_response(enqueue_job(urls))
              
         results = []
         
-        for url_input in urls:
-            # Step 1-4: Clean, validate, and detect homepage URL
-            homepage_url, detection_status = detect_homepage_url(url_input)
-            
-            if not homepage_url:
-                results.append({
-                    'original_url': url_input,
-                    'error': f'Homepage detection failed: {detection_status}'
-                })
-                continue
-            
-            # Step 5-6: Check ads.txt and app-ads.txt files
-            ads_url = homepage_url + 'ads.txt'
-            app_ads_url = homepage_url + 'app-ads.txt'
+        if urls:
+            # Probe each distinct host once, using its first input URL
+            probes = {}
+            for url_input in urls:
+                probes.setdefault(dedupe_key(url_input), url_input)
             
-            ads_result = check_file(ads_url)
-            app_ads_result = check_file(app_ads_url)
+            # Hosts are checked concurrently; map() keeps results aligned with probes
+            with ThreadPoolExecutor(max_workers=min(CHECK_MAX_WORKERS, len(probes))) as executor:
+                probe_results = dict(zip(probes, executor.map(partial(check_single_url, force_refresh=force_refresh), probes.values())))
             
-            # Step 7: Prepare result
-            results.append({
-                'original_url': url_input,
-                'homepage_url': homepage_url,
-                'homepage_detection': detection_status,
-                'ads_txt': ads_result,
-                'app_ads_txt': app_ads_result
-            })
+            # Fan the shared result back out to every original input
+            for url_input in urls:
+                result = dict(probe_results[dedupe_key(url_input)])
+                result['original_url'] = url_input
+                results.append(result)
             
-        return JsonResponse({'success': True, 'results': results})
+        return json_response({'success': True, 'results': results})
         
     except Exception as e:
-        return JsonResponse({'success': False, 'error': str(e)}, status=500)
+        return json_response({'success': False, 'error': str(e)}, status=500)
 
 
+def enqueue_job(urls):
+    """Create a Job for the URLs, queue it on Django-Q2 and return the response payload"""
+    # Imported here because tasks.py imports detect_homepage_url/check_file from this module
+    from .tasks import process_ads_txt_job
+    
+    # Create job record
+    job = Job.objects.create(
+        scraper_type='ads_txt_checker',
+        status='running',
+        total_items=len(urls),
+        processed_items=0,
+        input_data={'urls': urls}  # Save inputs for resumption
+    )
+    
+    # Submit to Django-Q2 background task queue
+    async_task(process_ads_txt_job, str(job.job_id), urls)
+    
+    return {
+        'success': True,
+        'job_id': str(job.job_id),
+        'message': f'Job submitted with {len(urls)} URLs'
+    }
+
 @csrf_exempt
 @require_http_methods(["POST"])
 def submit_job(request):
     """Submit a new ads.txt checking job to Celery"""
     try:
-        from scrapers.jobs.models import Job, JobEvent
-        from .tasks import process_ads_txt_job
-        import uuid
-        
         if request.content_type == 'application/json':
             data = json.loads(request.body)
             urls = data.get('urls', [])
@@ -335,26 +712,9 @@ def submit_job(request):
             urls = request.POST.getlist('urls[]')
         
         if not urls:
-            return JsonResponse({'success': False, 'error': 'No URLs provided'}, status=400)
-        
-        # Create job record
-        job = Job.objects.create(
-            scraper_type='ads_txt_checker',
-            status='running',
-            total_items=len(urls),
-            processed_items=0,
-            input_data={'urls': urls}  # Save inputs for resumption
-        )
-        
-        # Submit to Django-Q2 background task queue
-        from django_q.tasks import async_task
-        task_id = async_task(process_ads_txt_job, str(job.job_id), urls)
+            return json_response({'success': False, 'error': 'No URLs provided'}, status=400)
         
-        return JsonResponse({
-            'success': True,
-            'job_id': str(job.job_id),
-            'message': f'Job submitted with {len(urls)} URLs'
-        })
+        return json_response(enqueue_job(urls))
         
     except Exception as e:
-        return JsonResponse({'success': False, 'error': str(e)}, status=500)
+        return json_response({'success': False, 'error': str(e)}, status=500)
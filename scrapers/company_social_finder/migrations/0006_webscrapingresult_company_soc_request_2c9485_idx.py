@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('company_social_finder', '0005_delete_scrapingrequest'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='webscrapingresult',
+            index=models.Index(fields=['request', 'field_name'], name='company_soc_request_2c9485_idx'),
+        ),
+    ]
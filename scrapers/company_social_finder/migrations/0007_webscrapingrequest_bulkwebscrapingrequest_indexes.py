@@ -0,0 +1,25 @@
+# Generated by Django 5.2 on 2026-10-16 10:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('company_social_finder', '0006_webscrapingresult_company_soc_request_2c9485_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='webscrapingrequest',
+            index=models.Index(fields=['-created_at'], name='company_soc_created_0d141f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bulkwebscrapingrequest',
+            index=models.Index(fields=['-created_at'], name='company_soc_created_9caa03_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bulkwebscrapingrequest',
+            index=models.Index(fields=['status', '-created_at'], name='company_soc_status_72113c_idx'),
+        ),
+    ]
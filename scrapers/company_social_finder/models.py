@@ -1,3 +1,4 @@
+import json
 from django.db import models
 from django.utils import timezone
 from django.core.validators import FileExtensionValidator
@@ -25,6 +26,9 @@ class WebScrapingRequest(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at']),
+        ]
     
     def __str__(self):
         return f"Web Scrape: {self.url} - {self.created_at}"
@@ -40,9 +44,28 @@ class WebScrapingResult(models.Model):
     
     class Meta:
         ordering = ['request', 'field_name']
+        indexes = [
+            models.Index(fields=['request', 'field_name']),
+        ]
     
     def __str__(self):
         return f"{self.request.url} - {self.field_name}"
+    
+    @classmethod
+    def bulk_create_from_results(cls, request, results):
+        """
+        Save extracted results ({'field_name', 'value', 'selector'} dicts) for a request
+        with batched INSERTs instead of one query per field.
+        """
+        return cls.objects.bulk_create([
+            cls(
+                request=request,
+                field_name=result['field_name'],
+                field_value=json.dumps(result['value']) if isinstance(result['value'], (list, dict)) else str(result['value']),
+                selector=result.get('selector', '')
+            )
+            for result in results
+        ], batch_size=1000)
 
 
 class BulkWebScrapingRequest(models.Model):
@@ -82,6 +105,10 @@ class BulkWebScrapingRequest(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['status', '-created_at']),
+        ]
     
     def get_url_list(self):
         """Helper to combine URLs from text, file, and legacy JSON field"""
@@ -95,14 +122,14 @@ class BulkWebScrapingRequest(models.Model):
         if self.urls_file:
             try:
                 self.urls_file.open('r')
-                content = self.urls_file.read()
-                
-                # Handle bytes vs str depending on storage
-                if isinstance(content, bytes):
-                    content = content.decode('utf-8')
-                
-                lines = content.splitlines()
-                urls.extend([l.strip() for l in lines if l.strip()])
+                # Read line by line rather than loading the whole upload at once
+                for line in self.urls_file:
+                    # Handle bytes vs str depending on storage
+                    if isinstance(line, bytes):
+                        line = line.decode('utf-8', errors='replace')
+                    line = line.strip()
+                    if line:
+                        urls.append(line)
                 self.urls_file.close()
             except Exception as e:
                 print(f"Error reading file: {e}")
@@ -111,8 +138,8 @@ class BulkWebScrapingRequest(models.Model):
         if self.urls and isinstance(self.urls, list):
             urls.extend([str(u).strip() for u in self.urls if u])
         
-        # Remove duplicates and empty strings
-        return list(set([u for u in urls if u]))
+        # Remove duplicates and empty strings, keeping the input order
+        return list(dict.fromkeys(u for u in urls if u))
     
     def __str__(self):
         return f"Bulk Scrape: {self.total_urls} URLs - {self.status}"
@@ -0,0 +1,204 @@
+import random
+import re
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+from django.test import SimpleTestCase
+
+from .views import (
+    BULK_FALLBACK_SELECTORS, FALLBACK_SELECTORS, PageIndex, find_phone_match, resolve_href,
+    select_first_matching,
+)
+
+
+class ResolveHrefTests(SimpleTestCase):
+    """resolve_href must give the same result as the urljoin call it replaced"""
+
+    BASE_URLS = (
+        'https://example.com',
+        'https://example.com/',
+        'https://example.com/dir/page.html',
+        'https://example.com:8080/a/b/',
+        'https://user@example.com/a',
+        'https://example.com/a?x=1#y',
+        'https://example.com/a;p',
+        'HTTP://Example.COM/A',
+        'example.com/page',
+        '//example.com/page',
+        '/local/path',
+        '',
+    )
+
+    HREFS = (
+        # Plain root-relative paths (fast path)
+        '/', '/about', '/a/b/c.html', '/a-b_c~d/e.f', '/a?q=1', '/a#frag', '/a?q=1#f',
+        '/a?q=/..//x', '/%7Euser', '/café',
+        # Dot segments
+        '/.', '/..', '/a/..', '/a/../b', '/./x', '/a/./b', '/a/.hidden', '/a/b/.',
+        # Doubled slashes
+        '//cdn.example.com/x', '//', '/a//b', '/a/b//',
+        # Path params
+        '/a;p=1', '/a;p?q', '/;',
+        # Empty query/fragment
+        '/a?', '/a#', '/a?#', '/a??', '/a##', '/a?q#', '/a#f?',
+        # Control and non-printable characters
+        '/\tx', '/a\nb', '/a\rb', '/a\x00b', '/a\x7f', '/a b', '/a b', ' /a', '/a ',
+        # Relative and special hrefs
+        '', '#top', '?q', 'relative/path', '../up', './here', '.', '..',
+        'mailto:x@y.z', 'tel:123', 'javascript:void(0)', 'ftp://files.example.com/a',
+    )
+
+    def test_matches_urljoin(self):
+        for base_url in self.BASE_URLS:
+            for href in self.HREFS:
+                with self.subTest(base_url=base_url, href=href):
+                    self.assertEqual(resolve_href(href, base_url), urljoin(base_url, href))
+
+    def test_absolute_http_hrefs_are_returned_unchanged(self):
+        for href in ('https://other.com/x', 'http://other.com/a/../b?', 'https://other.com/a#'):
+            with self.subTest(href=href):
+                self.assertEqual(resolve_href(href, 'https://example.com/page'), href)
+
+
+def select_sequentially(soup, selectors):
+    """The per-selector loop select_first_matching replaced"""
+    for selector in selectors:
+        elements = soup.select(selector)
+        if elements:
+            return selector, elements
+    return None, []
+
+
+class FallbackSelectorTests(SimpleTestCase):
+    """select_first_matching and PageIndex.select_fallback must pick the same selector and
+    elements as running soup.select() for each selector in turn"""
+
+    PAGES = {
+        'empty': '<html><body></body></html>',
+        'full': """
+            <html><head><title>Acme | Home</title>
+            <meta property="og:site_name" content="Acme"></head>
+            <body>
+            <header><a href="/"><span class="logo-text">Acme</span></a>
+            <nav class="navbar"><a class="navbar-brand brand" href="/">Acme</a>
+            <a href="/contact-us">Contact</a></nav></header>
+            <h1 class="title">Acme Corp</h1>
+            <div class="phone">+1 555 010 0000</div>
+            <a href="tel:+15550100001">Call</a>
+            <a class="email" href="mailto:info@acme.test">Mail</a>
+            <span itemprop="email">sales@acme.test</span>
+            <footer><a href="https://facebook.com/acme">fb</a>
+            <a class="social" href="https://twitter.com/acme">tw</a>
+            <a href="https://www.linkedin.com/company/acme/">in</a></footer>
+            </body></html>""",
+        'itemprop_only': """
+            <html><body><div itemscope>
+            <span itemprop="name">Acme</span>
+            <span itemprop="telephone">+1 555 010 0002</span>
+            <a itemprop="email" href="/contact">sales@acme.test</a>
+            </div></body></html>""",
+        'non_anchor_contact_hrefs': """
+            <html><head><link href="tel:+15550100003"><link href="mailto:head@acme.test"></head>
+            <body><div href="tel:+15550100004">Call us</div>
+            <area href="mailto:area@acme.test">
+            <span class="tel">+1 555 010 0005</span></body></html>""",
+        'anchors_after_non_anchors': """
+            <html><body><div href="tel:+15550100006">Call</div>
+            <div href="mailto:div@acme.test">Mail</div>
+            <p><a href="tel:+15550100007">Call</a> <a href="mailto:a@acme.test">Mail</a>
+            <a href="https://example.com/?next=tel:1">x</a>
+            <a href="https://example.com/?next=mailto:x">y</a></p></body></html>""",
+        'substring_only': """
+            <html><body><a href="callto:tel:+15550100008">Call</a>
+            <a href="/send?to=mailto:x@acme.test">Mail</a>
+            <a href=" tel:+15550100009">Spaced</a>
+            <a href="TEL:+15550100010">Upper</a></body></html>""",
+        'nested': """
+            <html><body><div class="logo"><a href="/home">Acme</a></div>
+            <div class="social-media"><a href="https://instagram.com/acme">ig</a></div>
+            <footer><a href="/contactus">Contact</a><a href="https://youtube.com/acme">yt</a></footer>
+            <div class="contact-phone"><a class="phone" href="tel:+15550100011">Call</a></div>
+            </body></html>""",
+    }
+
+    def assert_same_as_sequential(self, select):
+        for page_name, page in self.PAGES.items():
+            soup = BeautifulSoup(page, 'lxml')
+            for selector_map in (FALLBACK_SELECTORS, BULK_FALLBACK_SELECTORS):
+                for field_name, selectors in selector_map.items():
+                    with self.subTest(page=page_name, field=field_name, selectors=selectors):
+                        expected_selector, expected = select_sequentially(soup, selectors)
+                        selector, elements = select(soup, selectors)
+                        self.assertEqual(selector, expected_selector)
+                        # Compare identities: the very same Tag objects in the same order
+                        self.assertEqual([id(elem) for elem in elements], [id(elem) for elem in expected])
+
+    def test_select_first_matching(self):
+        self.assert_same_as_sequential(select_first_matching)
+
+    def test_page_index_select_fallback(self):
+        self.assert_same_as_sequential(lambda soup, selectors: PageIndex(soup).select_fallback(selectors))
+
+
+# The phone patterns and filter exactly as the per-pattern findall over the page used them
+BASELINE_PHONE_PATTERNS = [
+    r'\+?1?[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # US format with optional country code
+    r'\+?\d{1,3}[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9}',  # International
+    r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # US format
+    r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',  # Simple format
+    r'\+?[\d\s\-\(\)\.]{10,}',  # General pattern
+]
+
+
+def find_phone_match_baseline(text):
+    for pattern in BASELINE_PHONE_PATTERNS:
+        for match in re.findall(pattern, text):
+            if 10 <= len(re.sub(r'[^\d]', '', match)) <= 15:
+                return match
+    return None
+
+
+class FindPhoneMatchTests(SimpleTestCase):
+    """find_phone_match must return what a findall of each pattern over the whole text did"""
+
+    TEXTS = (
+        '',
+        'No numbers here at all',
+        'Call +1 (555) 010-0000 today',
+        'Tel: 555.010.0000, Fax: 555.010.0001',
+        # Runs holding fewer than 10 digits, alone and next to a real number
+        'Founded 1999, zip 90210, ext. 12',
+        '(555) 010-000',
+        'Opening hours 09:00-17:00 (Mon-Fri) call 020 7946 0000',
+        '1-2-3-4-5-6-7-8-9',
+        # Matches with more than 15 digits
+        'Order 1234567890123456 ships today',
+        'IBAN 12345678901234567890 or call 555-010-0000',
+        '0000 0000 0000 0000 0000',
+        # Order across patterns: a later pattern's earlier match must not win
+        '12 34 5678 90 and then 555-010-0000',
+        '+44 20 7946 0000',
+        '+49 (0) 30 1234567',
+        '12-34-56-78-90-12',
+        '(((((((((((',
+        '+ + + + + + 1234567890',
+        '...........5550100000...........',
+        'a1b2c3d4e5f6g7h8i9j0k1',
+        '555\n010\n0000',
+        '555\t010\t0000 \u00a0 555 010 0001',
+        '+1555010000055501000005550100000',
+        '(555)0100000(555)0100001',
+    )
+
+    def test_matches_per_pattern_findall(self):
+        for text in self.TEXTS:
+            with self.subTest(text=text):
+                self.assertEqual(find_phone_match(text), find_phone_match_baseline(text))
+
+    def test_matches_per_pattern_findall_on_random_text(self):
+        rng = random.Random(0)
+        alphabet = '0123456789' * 4 + ' -.()+\n\tabx,:;/'
+        for _ in range(3000):
+            text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+            with self.subTest(text=text):
+                self.assertEqual(find_phone_match(text), find_phone_match_baseline(text))
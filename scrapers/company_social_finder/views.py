@@ -1,15 +1,23 @@
 import json
+import logging
+import sys
 import requests
 import csv
 import time
 import copy
 import uuid
+import functools
 import re
 import os
 import threading
+import http.cookiejar
+import atexit
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin, urlparse, urlunparse
 from bs4 import BeautifulSoup
 from lxml import etree, html
+from requests.adapters import HTTPAdapter
 from django.http import JsonResponse, HttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
@@ -31,12 +39,70 @@ from scrapers.ecommerce_scraper.scraper_helpers import (
     scrape_product_etsy,
 )
 
+logger = logging.getLogger(__name__)
+
 try:
     import urllib3
+    from urllib3.util.retry import Retry
     URLLIB3_AVAILABLE = True
 except ImportError:
     URLLIB3_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Up to 3 attempts on connection errors, read timeouts and 5xx responses, backing off
+# exponentially. POST is not retried (urllib3's default allowed_methods), and SSL errors
+# are not either, so make_request_with_retry can fall back to an unverified request.
+if URLLIB3_AVAILABLE:
+    HTTP_RETRY = Retry(
+        total=2,
+        connect=2,
+        read=2,
+        other=0,
+        backoff_factor=2,
+        status_forcelist=(500, 502, 503, 504),
+        raise_on_status=False,
+    )
+else:
+    HTTP_RETRY = 2
+
+# One requests.Session per thread so repeated requests to the same host reuse
+# keep-alive connections instead of a new TCP/TLS handshake per call. The session
+# is shared by every user's requests, so it must never store cookies: a Set-Cookie
+# from one call would otherwise be replayed on the next call to that domain.
+_thread_local = threading.local()
+
+
+def get_session():
+    """Return the calling thread's requests.Session, creating it on first use"""
+    session = getattr(_thread_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(pool_connections=50, pool_maxsize=50, max_retries=HTTP_RETRY)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        _thread_local.session = session
+    return session
+
+
+def loads_json(data):
+    """
+    Parse JSON from bytes or str with orjson when it is installed. Input orjson
+    rejects (non-UTF-8 encodings, NaN, integers beyond 64 bits) is retried with
+    the stdlib json module, so results match json.loads.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
 
 def extract_field_paths(obj, parent_key='', sep='.', max_depth=10, current_depth=0):
     """
@@ -44,38 +110,40 @@ def extract_field_paths(obj, parent_key='', sep='.', max_depth=10, current_depth
     
     Args:
         obj: Object to extract paths from (dict, list, or primitive)
-        parent_key: Parent key prefix (used recursively)
+        parent_key: Parent key prefix
         sep: Separator for nested keys (default: '.')
         max_depth: Maximum depth to traverse (prevent infinite loops)
-        current_depth: Current depth in recursion
+        current_depth: Depth of obj itself
     
     Returns:
         Set of field paths (e.g., {'id', 'name', 'address.city', 'address.country.label'})
     """
     field_paths = set()
     
-    if current_depth >= max_depth:
-        return field_paths
-    
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            field_paths.add(new_key)
-            
-            if isinstance(v, (dict, list)):
-                # Recursively extract paths from nested structures
-                nested_paths = extract_field_paths(v, new_key, sep=sep, max_depth=max_depth, current_depth=current_depth + 1)
-                field_paths.update(nested_paths)
-    elif isinstance(obj, list) and len(obj) > 0:
-        # For lists, check the first item if it's a dict
-        first_item = obj[0]
-        if isinstance(first_item, dict):
-            nested_paths = extract_field_paths(first_item, parent_key, sep=sep, max_depth=max_depth, current_depth=current_depth + 1)
-            field_paths.update(nested_paths)
-        else:
-            # For simple lists, just add the parent key
-            if parent_key:
-                field_paths.add(parent_key)
+    # Iterative walk with an explicit stack of (node, key prefix, depth) instead of recursion.
+    # Keys are interned since the same paths repeat across every record of a response.
+    stack = [(obj, parent_key, current_depth)]
+    while stack:
+        node, prefix, depth = stack.pop()
+        if depth >= max_depth:
+            continue
+        
+        if isinstance(node, dict):
+            key_prefix = prefix + sep if prefix else ''
+            for k, v in node.items():
+                new_key = sys.intern(key_prefix + str(k))
+                field_paths.add(new_key)
+                
+                if isinstance(v, (dict, list)):
+                    stack.append((v, new_key, depth + 1))
+        elif isinstance(node, list) and len(node) > 0:
+            # For lists, check the first item if it's a dict
+            first_item = node[0]
+            if isinstance(first_item, dict):
+                stack.append((first_item, prefix, depth + 1))
+            elif prefix:
+                # For simple lists, just add the parent key
+                field_paths.add(prefix)
     
     return field_paths
 
@@ -86,28 +154,163 @@ def flatten_dict(d, parent_key='', sep='.'):
     
     Args:
         d: Dictionary to flatten
-        parent_key: Parent key prefix (used recursively)
+        parent_key: Parent key prefix
         sep: Separator for nested keys (default: '.')
     
     Returns:
         Flattened dictionary with dot-separated keys
     """
-    items = []
-    for k, v in d.items():
-        new_key = f"{parent_key}{sep}{k}" if parent_key else k
-        if isinstance(v, dict):
-            items.extend(flatten_dict(v, new_key, sep=sep).items())
-        elif isinstance(v, list):
-            # For lists, convert to JSON string or handle each item
-            if len(v) > 0 and isinstance(v[0], dict):
-                # If list contains dicts, convert to JSON string
-                items.append((new_key, json.dumps(v, ensure_ascii=False)))
+    flattened = {}
+    
+    # Depth-first walk over a stack of item iterators, so keys come out in the same
+    # order as a recursive flatten without building intermediate dicts per level
+    stack = [(iter(d.items()), parent_key + sep if parent_key else '')]
+    while stack:
+        items, key_prefix = stack[-1]
+        for k, v in items:
+            new_key = sys.intern(key_prefix + str(k))
+            if isinstance(v, dict):
+                stack.append((iter(v.items()), new_key + sep))
+                break
+            elif isinstance(v, list):
+                # Lists (of dicts or simple values) are stored as JSON strings
+                flattened[new_key] = json.dumps(v, ensure_ascii=False)
             else:
-                # For simple lists, join with semicolon or convert to JSON
-                items.append((new_key, json.dumps(v, ensure_ascii=False)))
+                flattened[new_key] = v
         else:
-            items.append((new_key, v))
-    return dict(items)
+            stack.pop()
+    
+    return flattened
+
+
+@functools.lru_cache(maxsize=4096)
+def compile_accessor(parts):
+    """
+    Return a function that looks up the key path `parts` in a record and returns
+    None when any step is missing or not a dict. Paths of up to three keys are
+    unrolled into direct subscripts instead of a per-record loop over the parts.
+    """
+    if len(parts) == 1:
+        k0, = parts
+        def accessor(record):
+            try:
+                return record[k0]
+            except (KeyError, TypeError):
+                return None
+    elif len(parts) == 2:
+        k0, k1 = parts
+        def accessor(record):
+            try:
+                return record[k0][k1]
+            except (KeyError, TypeError):
+                return None
+    elif len(parts) == 3:
+        k0, k1, k2 = parts
+        def accessor(record):
+            try:
+                return record[k0][k1][k2]
+            except (KeyError, TypeError):
+                return None
+    else:
+        def accessor(record):
+            try:
+                for part in parts:
+                    record = record[part]
+                return record
+            except (KeyError, TypeError):
+                return None
+    return accessor
+
+
+def is_exhibitor_record(record):
+    """
+    Whether a record is an exhibitor object taken from a result.hits response (it has
+    'id' and 'name' but no 'exhibitor' key), so its field paths need the
+    'exhibitor.' prefix stripped.
+    """
+    return isinstance(record, dict) and 'id' in record and 'name' in record and 'exhibitor' not in record
+
+
+def compile_paths(fields, strip_prefix=None):
+    """
+    Clean and split field paths once per batch so records can be filtered without
+    re-parsing the paths for every record. If strip_prefix is given (e.g.
+    'exhibitor.'), it is removed from the paths that start with it.
+    
+    A path nested under another selected path (e.g. 'exhibitor.name' next to
+    'exhibitor') is already carried by the ancestor's value, so it is folded into
+    the ancestor, which keeps the earliest position of the two.
+    
+    Returns:
+        List of (key tuple, accessor) pairs, e.g. (('exhibitor', 'name'), <accessor>);
+        see compile_accessor()
+    """
+    split_paths = []
+    for field_path in fields:
+        if isinstance(field_path, str):
+            field_path = field_path.strip()
+        else:
+            field_path = str(field_path).strip()
+        if strip_prefix and field_path.startswith(strip_prefix):
+            field_path = field_path[len(strip_prefix):].strip()
+        if field_path:
+            split_paths.append(tuple(field_path.split('.')))
+    
+    selected = set(split_paths)
+    compiled = []
+    seen = set()
+    for parts in split_paths:
+        for i in range(1, len(parts)):
+            if parts[:i] in selected:
+                parts = parts[:i]
+                break
+        if parts not in seen:
+            seen.add(parts)
+            compiled.append((parts, compile_accessor(parts)))
+    return compiled
+
+
+def filter_record_fields_fast(record, compiled_paths):
+    """
+    Filter a record using paths prepared by compile_paths().
+    
+    Values are shared with the source record rather than copied: the filtered
+    records are only serialized, never mutated. Since no compiled path is a prefix
+    of another, every intermediate dict is created here and nothing is merged.
+    """
+    if not isinstance(record, dict):
+        return record
+    
+    filtered = {}
+    
+    for parts, accessor in compiled_paths:
+        value = accessor(record)
+        
+        # If value found, set it in filtered dict using the same structure
+        if value is not None:
+            current = filtered
+            for part in parts[:-1]:
+                current = current.setdefault(part, {})
+            current[parts[-1]] = value
+    
+    return filtered
+
+
+def filter_records(records, compiled_paths):
+    """
+    Filter a batch of records with paths prepared by compile_paths().
+    
+    When every path is a single top-level key (the common case), the batch is filtered
+    with a flat dict comprehension per record instead of building nested output.
+    """
+    if all(len(parts) == 1 for parts, accessor in compiled_paths):
+        keys = [parts[0] for parts, accessor in compiled_paths]
+        return [
+            {key: value for key in keys if (value := record.get(key)) is not None}
+            if isinstance(record, dict) else record
+            for record in records
+        ]
+    return [filter_record_fields_fast(record, compiled_paths) for record in records]
 
 
 def filter_record_fields(record, fields):
@@ -115,6 +318,9 @@ def filter_record_fields(record, fields):
     Filter a record to keep only specified fields.
     Supports dot notation for nested fields (e.g., 'exhibitor.name').
     
+    When filtering many records, compile the paths once with compile_paths()
+    and call filter_record_fields_fast() instead.
+    
     Args:
         record: Dictionary to filter
         fields: List of field paths (e.g., ['name', 'exhibitor.name', 'exhibitor.address.city'])
@@ -128,69 +334,23 @@ def filter_record_fields(record, fields):
     if not isinstance(record, dict):
         return record
     
-    filtered = {}
-    
-    for field_path in fields:
-        # Clean and split field path by dots to handle nested fields
-        if isinstance(field_path, str):
-            field_path = field_path.strip()
-        else:
-            field_path = str(field_path).strip()
-            
-        if not field_path:
-            continue
-            
-        parts = field_path.split('.')
-        value = record
-        
-        # Navigate through nested structure
-        for part in parts:
-            if isinstance(value, dict) and part in value:
-                value = value[part]
-            else:
-                value = None
-                break
-        
-        # If value found, set it in filtered dict using the same structure
-        if value is not None:
-            # Deep copy the value to avoid reference issues
-            if isinstance(value, (dict, list)):
-                value = copy.deepcopy(value)
-            
-            current = filtered
-            # Build the nested structure for all parts except the last
-            for i, part in enumerate(parts[:-1]):
-                if part not in current:
-                    current[part] = {}
-                elif not isinstance(current[part], dict):
-                    # If the path already exists but is not a dict, replace it with a dict
-                    current[part] = {}
-                current = current[part]
-            
-            # Set the final value
-            # Only overwrite if the key doesn't exist or if it's not a dict
-            final_key = parts[-1]
-            if final_key not in current:
-                current[final_key] = value
-            elif isinstance(current[final_key], dict) and isinstance(value, dict):
-                # Merge dictionaries if both are dicts
-                def merge_dicts(d1, d2):
-                    """Recursively merge two dictionaries"""
-                    result = copy.deepcopy(d1)
-                    for k, v in d2.items():
-                        if k in result and isinstance(result[k], dict) and isinstance(v, dict):
-                            result[k] = merge_dicts(result[k], v)
-                        else:
-                            result[k] = copy.deepcopy(v)
-                    return result
-                current[final_key] = merge_dicts(current[final_key], value)
-            else:
-                # Overwrite if types don't match or value is not a dict
-                current[final_key] = value
-    
-    return filtered
+    return filter_record_fields_fast(record, compile_paths(fields))
+
+
+# Trailing characters commonly left on URLs copied out of CSV files
+URL_TRAILING_CHARS = '.,;)\\]}'
+
+# Inputs longer than this, or with more percent-escapes, are rejected before parsing
+MAX_URL_LENGTH = 2048
+MAX_URL_PERCENT_ESCAPES = 64
+
+# URLs that urlparse/urlunparse would return unchanged: lowercase scheme and host, no
+# userinfo, no path params and non-empty query/fragment (normalize_url checks the
+# trailing slash separately)
+CANONICAL_URL_RE = re.compile(r'https?://[a-z0-9.\-]+(?::[0-9]+)?(/[^?#;\s]*)?(\?[^#\s]+)?(#\S+)?')
 
 
+@functools.lru_cache(maxsize=16384)
 def normalize_url(url):
     """
     Normalize and validate a URL.
@@ -198,6 +358,8 @@ def normalize_url(url):
     - Adds http:// or https:// if missing
     - Removes trailing slashes (optional, can be configured)
     - Validates URL format
+    
+    Results are cached, since uploaded URL lists often repeat the same URLs.
     """
     if not url:
         return None
@@ -208,8 +370,14 @@ def normalize_url(url):
     if not url:
         return None
     
-    # Remove common trailing characters that might be in CSV
-        url = url.rstrip('.,;)\\]}')
+    # Reject obviously malformed input (e.g. garbage in uploaded CSVs) without parsing it
+    if len(url) > MAX_URL_LENGTH or url.count('%') > MAX_URL_PERCENT_ESCAPES or '\x00' in url:
+        return None
+    
+    # Remove common trailing characters that might be in CSV (most URLs are clean,
+    # so only strip when the last character is one of them)
+    if url[-1] in URL_TRAILING_CHARS:
+        url = url.rstrip(URL_TRAILING_CHARS)
     
     # If URL doesn't start with http:// or https://, add https://
     if not url.startswith(('http://', 'https://')):
@@ -219,6 +387,13 @@ def normalize_url(url):
         else:
             return None  # Invalid URL format
     
+    # Already canonical URLs need no parse/reconstruct round trip
+    match = CANONICAL_URL_RE.fullmatch(url)
+    if match:
+        path = match.group(1)
+        if not path or path == '/' or path[-1] != '/':
+            return url
+    
     # Parse and reconstruct URL to normalize it
     try:
         parsed = urlparse(url)
@@ -232,9 +407,8 @@ def normalize_url(url):
             parsed.fragment
         ))
         return normalized
-    except Exception as e:
-        if settings.DEBUG:
-            print(f"URL normalization error for '{url}': {e}")
+    except ValueError as e:
+        logger.debug("URL normalization error for '%s': %s", url, e)
         return None
 
 
@@ -242,11 +416,15 @@ def make_request_with_retry(url, headers=None, timeout=30, max_retries=3, verify
     """
     Make HTTP request with retry logic and SSL handling.
     
+    The request goes through the calling thread's pooled session (get_session()), so
+    connections are kept alive between calls; connection errors, timeouts and 5xx
+    responses are retried with exponential backoff by urllib3 (HTTP_RETRY).
+    
     Args:
         url: URL to request
         headers: Request headers
         timeout: Request timeout in seconds
-        max_retries: Maximum number of retry attempts
+        max_retries: Kept for existing callers; attempts are bounded by HTTP_RETRY
         verify_ssl: Whether to verify SSL certificates
     
     Returns:
@@ -259,57 +437,194 @@ def make_request_with_retry(url, headers=None, timeout=30, max_retries=3, verify
     if not verify_ssl and URLLIB3_AVAILABLE:
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
     
-    last_exception = None
-    
-    for attempt in range(max_retries):
+    session = get_session()
+    try:
         try:
-            response = requests.get(
-                url,
-                headers=headers,
-                timeout=timeout,
-                verify=verify_ssl,
-                allow_redirects=True
-            )
-            return response
-        except requests.exceptions.SSLError as e:
-            last_exception = e
+            return session.get(url, headers=headers, timeout=timeout, verify=verify_ssl, allow_redirects=True)
+        except requests.exceptions.SSLError:
+            if not verify_ssl:
+                raise
             # Try again with SSL verification disabled
-            if verify_ssl and attempt < max_retries - 1:
-                if settings.DEBUG:
-                    print(f"SSL error for {url}, retrying with SSL verification disabled...")
-                verify_ssl = False
-                urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-                continue
-            else:
-                if settings.DEBUG:
-                    print(f"SSL error for {url} after {attempt + 1} attempts: {e}")
-        except requests.exceptions.ConnectionError as e:
-            last_exception = e
-            if attempt < max_retries - 1:
-                wait_time = (attempt + 1) * 2  # Exponential backoff: 2s, 4s, 6s
-                if settings.DEBUG:
-                    print(f"Connection error for {url}, retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-                time.sleep(wait_time)
-            else:
-                if settings.DEBUG:
-                    print(f"Connection error for {url} after {max_retries} attempts: {e}")
-        except requests.exceptions.Timeout as e:
-            last_exception = e
-            if attempt < max_retries - 1:
-                wait_time = (attempt + 1) * 2
-                if settings.DEBUG:
-                    print(f"Timeout for {url}, retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-                time.sleep(wait_time)
-            else:
-                if settings.DEBUG:
-                    print(f"Timeout for {url} after {max_retries} attempts: {e}")
-        except requests.exceptions.RequestException as e:
-            last_exception = e
             if settings.DEBUG:
-                print(f"Request error for {url}: {e}")
-            break  # Don't retry for other request exceptions
+                print(f"SSL error for {url}, retrying with SSL verification disabled...")
+            if URLLIB3_AVAILABLE:
+                urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            return session.get(url, headers=headers, timeout=timeout, verify=False, allow_redirects=True)
+    except requests.exceptions.RequestException as e:
+        if settings.DEBUG:
+            print(f"Request error for {url}: {e}")
+        return None
+
+
+# Selenium and Playwright are optional and only needed for JavaScript rendering; they are
+# imported on first use and cached here instead of being re-imported inside every request
+_selenium_modules = None
+_sync_playwright = None
+
+
+def get_selenium():
+    """Return (webdriver, Options) from Selenium; raises ImportError if it is not installed"""
+    global _selenium_modules
+    if _selenium_modules is None:
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        _selenium_modules = (webdriver, Options)
+    return _selenium_modules
+
+
+def get_sync_playwright():
+    """Return Playwright's sync_playwright; raises ImportError if it is not installed"""
+    global _sync_playwright
+    if _sync_playwright is None:
+        from playwright.sync_api import sync_playwright
+        _sync_playwright = sync_playwright
+    return _sync_playwright
+
+
+# Headless Chrome instances are reused across JavaScript-rendered requests, since starting
+# Chrome takes seconds. The user agent is a launch option, so idle drivers are kept per
+# user agent, with at most SELENIUM_MAX_IDLE_DRIVERS idle in total.
+SELENIUM_MAX_IDLE_DRIVERS = 4
+_selenium_lock = threading.Lock()
+_idle_drivers = {}
+_idle_driver_count = 0
+
+
+def _create_chrome_driver(user_agent):
+    webdriver, Options = get_selenium()
     
-    return None
+    chrome_options = Options()
+    chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument(f'user-agent={user_agent}')
+    
+    # Try Chrome first, then Chromium
+    try:
+        return webdriver.Chrome(options=chrome_options)
+    except Exception:
+        # Fallback to Chromium if Chrome is not available
+        chrome_options.binary_location = '/usr/bin/chromium' if os.path.exists('/usr/bin/chromium') else '/usr/bin/chromium-browser'
+        return webdriver.Chrome(options=chrome_options)
+
+
+def borrow_driver(user_agent):
+    """Return an idle Chrome driver launched with user_agent, starting a new one if there is none"""
+    global _idle_driver_count
+    with _selenium_lock:
+        drivers = _idle_drivers.get(user_agent)
+        if drivers:
+            _idle_driver_count -= 1
+            return drivers.pop()
+    return _create_chrome_driver(user_agent)
+
+
+def return_driver(driver, user_agent):
+    """Put a driver back in the pool after use, or quit it if the pool is full"""
+    global _idle_driver_count
+    try:
+        # Don't carry cookies or the previous page over to the next request
+        driver.delete_all_cookies()
+        driver.get('about:blank')
+    except Exception:
+        quit_driver(driver)
+        return
+    with _selenium_lock:
+        if _idle_driver_count < SELENIUM_MAX_IDLE_DRIVERS:
+            _idle_drivers.setdefault(user_agent, []).append(driver)
+            _idle_driver_count += 1
+            return
+    quit_driver(driver)
+
+
+def quit_driver(driver):
+    """Quit a driver that failed or is no longer needed"""
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+@atexit.register
+def _quit_idle_drivers():
+    global _idle_driver_count
+    with _selenium_lock:
+        drivers = [driver for pooled in _idle_drivers.values() for driver in pooled]
+        _idle_drivers.clear()
+        _idle_driver_count = 0
+    for driver in drivers:
+        quit_driver(driver)
+
+
+# Shared pool for concurrent plain-HTTP fetches. They spend their time waiting on the
+# network, so threads overlap well; each worker uses its own session from get_session()
+FETCH_MAX_WORKERS = 32
+_fetch_executor = ThreadPoolExecutor(max_workers=FETCH_MAX_WORKERS)
+
+
+def fetch_many(urls, headers=None, timeout=30, verify_ssl=False):
+    """
+    Fetch URLs concurrently with make_request_with_retry().
+    
+    Yields (url, response) pairs in input order; response is None when the request
+    failed. At most 2 x FETCH_MAX_WORKERS requests are in flight or buffered at a
+    time, so responses never pile up faster than the caller processes them.
+    """
+    pending = deque()
+    for url in urls:
+        pending.append((url, _fetch_executor.submit(make_request_with_retry, url, headers, timeout, 3, verify_ssl)))
+        if len(pending) >= 2 * FETCH_MAX_WORKERS:
+            url, future = pending.popleft()
+            yield url, future.result()
+    while pending:
+        url, future = pending.popleft()
+        yield url, future.result()
+
+
+def detect_record_shape(response_data):
+    """
+    Locate the list of records in an API response.
+    
+    Returns (shape, records, writeback) where shape is one of:
+    - 'hits': result.hits (Messe Frankfurt API); records are the hits' exhibitor objects
+    - 'records': data.records (standard structure)
+    - 'data_list': data is itself a list of records
+    - 'root_list': the response is a list of records
+    - 'scalar': no record list found; records is empty and writeback is None
+    writeback(filtered_records) puts filtered records back in place of the originals
+    and returns the updated response.
+    """
+    if isinstance(response_data, list):
+        return 'root_list', response_data, lambda filtered_records: filtered_records
+    if not isinstance(response_data, dict):
+        return 'scalar', [], None
+    
+    result_section = response_data.get('result')
+    if isinstance(result_section, dict) and 'hits' in result_section:
+        # Use the exhibitor object of each hit; hits without one are kept as they are
+        records = [
+            hit['exhibitor'] if isinstance(hit, dict) and 'exhibitor' in hit else hit
+            for hit in result_section['hits']
+        ]
+        def writeback(filtered_records):
+            result_section['hits'] = filtered_records
+            return response_data
+        return 'hits', records, writeback
+    
+    data_section = response_data.get('data')
+    if isinstance(data_section, dict) and 'records' in data_section:
+        def writeback(filtered_records):
+            data_section['records'] = filtered_records
+            return response_data
+        return 'records', data_section['records'], writeback
+    if isinstance(data_section, list):
+        def writeback(filtered_records):
+            response_data['data'] = filtered_records
+            return response_data
+        return 'data_list', data_section, writeback
+    
+    return 'scalar', [], None
 
 
 @csrf_exempt
@@ -323,9 +638,10 @@ def scrape_api(request):
     - data: Request payload/data
     - headers: Optional custom headers
     """
+    scraping_request = None
     try:
         # Parse request data
-        body = json.loads(request.body)
+        body = loads_json(request.body)
         
         api_url = body.get('url')
         method = body.get('method', 'POST').upper()
@@ -345,10 +661,8 @@ def scrape_api(request):
             # Ensure all fields are strings and trimmed, filter out empty strings
             fields = [f.strip() if isinstance(f, str) else str(f).strip() for f in fields if f and str(f).strip()]
         
-        if settings.DEBUG:
-            print(f"[scrape_api] Fields received (raw): {body.get('fields')}")
-            print(f"[scrape_api] Fields after normalization: {fields}")
-            print(f"[scrape_api] Fields type: {type(fields)}, length: {len(fields) if isinstance(fields, list) else 'N/A'}")
+        logger.debug("[scrape_api] Fields received (raw): %s", body.get('fields'))
+        logger.debug("[scrape_api] Fields after normalization: %s", fields)
         
         # Validate required fields
         if not api_url:
@@ -356,8 +670,9 @@ def scrape_api(request):
                 'error': 'URL is required'
             }, status=400)
         
-        # Create scraping request record
-        scraping_request = ScrapingRequest.objects.create(
+        # Build the scraping request record in memory; every outcome below fills in the
+        # result and saves it once, so each call costs a single INSERT
+        scraping_request = ScrapingRequest(
             url=api_url,
             method=method,
             request_data=request_data
@@ -371,30 +686,31 @@ def scrape_api(request):
         default_headers.update(headers)
         
         # Make the API request
+        session = get_session()
         try:
             if method == 'POST':
-                response = requests.post(
+                response = session.post(
                     api_url,
                     json=request_data,
                     headers=default_headers,
                     timeout=30
                 )
             elif method == 'GET':
-                response = requests.get(
+                response = session.get(
                     api_url,
                     params=request_data,
                     headers=default_headers,
                     timeout=30
                 )
             elif method == 'PUT':
-                response = requests.put(
+                response = session.put(
                     api_url,
                     json=request_data,
                     headers=default_headers,
                     timeout=30
                 )
             elif method == 'DELETE':
-                response = requests.delete(
+                response = session.delete(
                     api_url,
                     headers=default_headers,
                     timeout=30
@@ -408,88 +724,40 @@ def scrape_api(request):
             
             # Try to parse JSON response
             try:
-                response_data = response.json()
+                response_data = loads_json(response.content)
             except ValueError:
                 response_data = {'raw_response': response.text}
             
             # Filter fields if specified
             if isinstance(fields, list) and len(fields) > 0:
                 # Try to extract records from response (similar to scrape_paginated logic)
-                records = []
-                data_section = response_data.get('data', {})
-                result_section = response_data.get('result', {})
-                
-                # Check for result.hits (Messe Frankfurt API structure)
-                if isinstance(result_section, dict) and 'hits' in result_section:
-                    hits = result_section['hits']
-                    # Extract exhibitor objects from hits (Messe Frankfurt API structure)
-                    records = []
-                    for hit in hits:
-                        if isinstance(hit, dict) and 'exhibitor' in hit:
-                            # Extract exhibitor object
-                            records.append(hit['exhibitor'].copy())
-                        else:
-                            # If no exhibitor key, use the hit itself
-                            records.append(hit)
-                # Check for data.records (standard structure)
-                elif isinstance(data_section, dict) and 'records' in data_section:
-                    records = data_section['records']
-                elif isinstance(data_section, list):
-                    records = data_section
-                elif isinstance(response_data, list):
-                    records = response_data
+                shape, records, writeback = detect_record_shape(response_data)
                 
                 # Filter records if found
                 if records:
                     # For Messe Frankfurt API (result.hits), if we extracted exhibitor objects,
                     # strip 'exhibitor.' prefix from field paths since records are already exhibitor objects
-                    normalized_fields = fields
-                    if isinstance(result_section, dict) and 'hits' in result_section and records:
-                        # Check if first record looks like an exhibitor object (has 'id', 'name', etc.)
-                        first_record = records[0] if records else {}
-                        if isinstance(first_record, dict) and 'id' in first_record and 'name' in first_record and 'exhibitor' not in first_record:
-                            # Strip 'exhibitor.' prefix from field paths
-                            normalized_fields = []
-                            for field in fields:
-                                field_str = str(field).strip()
-                                if field_str.startswith('exhibitor.'):
-                                    normalized_fields.append(field_str[10:])  # Remove 'exhibitor.' prefix
-                                else:
-                                    normalized_fields.append(field_str)
-                            if settings.DEBUG and normalized_fields != fields:
-                                print(f"[scrape_api] Normalized fields from {fields} to {normalized_fields}")
+                    strip_prefix = 'exhibitor.' if shape == 'hits' and is_exhibitor_record(records[0]) else None
                     
-                    if settings.DEBUG:
-                        print(f"[scrape_api] Filtering {len(records)} records with fields: {normalized_fields}")
+                    logger.debug("[scrape_api] Filtering %d records with fields: %s (stripping prefix: %s)", len(records), fields, strip_prefix)
                     
-                    filtered_records = [filter_record_fields(record, normalized_fields) for record in records]
+                    compiled_paths = compile_paths(fields, strip_prefix)
+                    filtered_records = filter_records(records, compiled_paths)
                     
-                    if settings.DEBUG:
-                        print(f"[scrape_api] Filtered to {len(filtered_records)} records")
-                        if filtered_records:
-                            sample_keys = list(filtered_records[0].keys())[:10] if isinstance(filtered_records[0], dict) else []
-                            print(f"[scrape_api] Sample filtered record keys: {sample_keys}")
+                    logger.debug("[scrape_api] Filtered to %d records", len(filtered_records))
+                    if filtered_records and isinstance(filtered_records[0], dict) and logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("[scrape_api] Sample filtered record keys: %s", list(filtered_records[0])[:10])
                     
-                    # Replace records in response
-                    if isinstance(result_section, dict) and 'hits' in result_section:
-                        # For Messe Frankfurt API, replace hits with filtered exhibitor records
-                        # But keep the structure - put filtered records back as hits
-                        response_data['result']['hits'] = filtered_records
-                    elif isinstance(data_section, dict) and 'records' in data_section:
-                        response_data['data']['records'] = filtered_records
-                    elif isinstance(data_section, list):
-                        response_data['data'] = filtered_records
-                    elif isinstance(response_data, list):
-                        response_data = filtered_records
+                    # Replace records in response (for result.hits, the filtered exhibitor
+                    # records are put back as the hits)
+                    response_data = writeback(filtered_records)
                 else:
                     # If no records found, filter the entire response
-                    if settings.DEBUG:
-                        print(f"[scrape_api] No records found, filtering entire response with fields: {fields}")
+                    logger.debug("[scrape_api] No records found, filtering entire response with fields: %s", fields)
                     response_data = filter_record_fields(response_data, fields)
             else:
                 # If no fields specified, keep original response
-                if settings.DEBUG:
-                    print(f"[scrape_api] No fields specified (fields={fields}), keeping original response")
+                logger.debug("[scrape_api] No fields specified (fields=%s), keeping original response", fields)
             
             # Update scraping request record
             scraping_request.status_code = response.status_code
@@ -536,6 +804,16 @@ def scrape_api(request):
         }, status=400)
         
     except Exception as e:
+        # Still record the failed call once its record has been built; the response
+        # data is dropped since saving it may be what failed
+        if scraping_request is not None and scraping_request.pk is None:
+            scraping_request.response_data = None
+            scraping_request.error_message = str(e)
+            scraping_request.completed_at = timezone.now()
+            try:
+                scraping_request.save()
+            except Exception as save_error:
+                logger.error("[scrape_api] Could not record failed request: %s", save_error)
         return JsonResponse({
             'error': f'Server error: {str(e)}'
         }, status=500)
@@ -579,6 +857,301 @@ def rapidapi_scraper(request):
     })
 
 
+# Patterns used when pulling emails, phone numbers and company names out of pages
+# Backtracking in the phone patterns is bounded: every quantifier has a fixed upper
+# limit except the last pattern's greedy tail, which nothing follows. find_phone_match
+# also runs them only over short runs of phone characters, never the whole page.
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+PHONE_PATTERNS = tuple(re.compile(p) for p in (
+    r'\+?1?[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # US format with optional country code
+    r'\+?\d{1,3}[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9}',  # International
+    r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # US format
+    r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',  # Simple format
+    r'\+?[\d\s\-\(\)\.]{10,}',  # General pattern
+))
+PHONE_STRIP_RE = re.compile(r'[^\d+\-() ]')
+NON_DIGIT_RE = re.compile(r'[^\d]')
+WS_RE = re.compile(r'\s+')
+SPLIT_RE = re.compile(r'[,\n\r;]')
+TITLE_SUFFIX_RE = re.compile(r'\s*[-|]\s*(Home|Welcome|Official).*$', re.IGNORECASE)
+
+# Domains whose links are reported as social media profiles
+SOCIAL_DOMAINS = (
+    'facebook.com', 'fb.com', 'm.facebook.com',
+    'twitter.com', 'x.com', 'mobile.twitter.com',
+    'linkedin.com', 'linkedin.com/company',
+    'instagram.com',
+    'youtube.com', 'youtu.be',
+    'tiktok.com',
+    'pinterest.com',
+    'snapchat.com',
+    'reddit.com',
+    'tumblr.com',
+    'flickr.com',
+    'vimeo.com',
+    'github.com',
+    'medium.com',
+    'behance.net',
+    'dribbble.com',
+)
+
+
+# Domains reported under each platform column; a platform takes its first matching link
+SOCIAL_PLATFORMS = {
+    'LinkedIn': ('linkedin.com',),
+    'Facebook': ('facebook.com', 'fb.com', 'm.facebook.com'),
+    'Twitter/X': ('twitter.com', 'x.com', 'mobile.twitter.com'),
+    'Instagram': ('instagram.com',),
+    'YouTube': ('youtube.com', 'youtu.be'),
+    'TikTok': ('tiktok.com',),
+    'Pinterest': ('pinterest.com',),
+    'Snapchat': ('snapchat.com',),
+    'Reddit': ('reddit.com',),
+    'Tumblr': ('tumblr.com',),
+    'Flickr': ('flickr.com',),
+    'Vimeo': ('vimeo.com',),
+    'GitHub': ('github.com',),
+    'Medium': ('medium.com',),
+    'Behance': ('behance.net',),
+    'Dribbble': ('dribbble.com',),
+}
+BULK_SOCIAL_PLATFORMS = {
+    'LinkedIn': ('linkedin.com',),
+    'Facebook': ('facebook.com', 'fb.com'),
+    'Twitter/X': ('twitter.com', 'x.com'),
+    'Instagram': ('instagram.com',),
+    'YouTube': ('youtube.com', 'youtu.be'),
+    'TikTok': ('tiktok.com',),
+    'Pinterest': ('pinterest.com',),
+}
+
+
+# Selectors tried in order for the predefined fields when the user gives none
+FALLBACK_SELECTORS = {
+    'Company Name': (
+        'h1', 'h1.title', '.company-name', '.brand', '.logo-text',
+        '[itemprop="name"]', '.site-title', 'title', 'meta[property="og:site_name"]',
+        'header h1', '.header h1', 'nav .brand', '.navbar-brand'
+    ),
+    'Homepage URL': (
+        'a.logo[href]', 'a[href="/"]', '.homepage-link', 'a.brand[href]',
+        'header a[href="/"]', 'nav a[href="/"]', '.logo a[href]'
+    ),
+    'Email': (
+        'a[href^="mailto:"]', '[itemprop="email"]', '.email', '.contact-email',
+        'a.email', '.mail', 'a[href*="mailto"]', '*[href^="mailto:"]'
+    ),
+    'Phone': (
+        'a[href^="tel:"]', '[itemprop="telephone"]', '.phone', '.contact-phone',
+        'a.phone', '.tel', 'a[href*="tel:"]', '*[href^="tel:"]'
+    ),
+    'Contact Page URL': (
+        'a[href*="contact"]', 'a.contact-link', 'nav a[href*="contact"]',
+        'a[href*="contact-us"]', 'a[href*="contactus"]', 'footer a[href*="contact"]'
+    ),
+    'Social Media URLs': (
+        'a[href*="facebook.com"]', 'a[href*="twitter.com"]', 'a[href*="linkedin.com"]',
+        'a[href*="instagram.com"]', 'a[href*="youtube.com"]', '.social-link',
+        'a.social', '.social-media a', 'footer a[href*="facebook"]',
+        'footer a[href*="twitter"]', 'footer a[href*="linkedin"]'
+    ),
+}
+HOMEPAGE_LINK_SELECTOR = 'a[href="/"], a.logo[href], .homepage-link[href], a.brand[href], header a[href="/"], nav a[href="/"]'
+
+# Shorter selector lists used by bulk scraping
+BULK_FALLBACK_SELECTORS = {
+    'Company Name': ('h1', '.company-name', '.brand', '.site-title', 'title'),
+    'Homepage URL': ('a[href="/"]', 'a.logo[href]', '.homepage-link[href]'),
+    'Email': ('a[href^="mailto:"]', '[itemprop="email"]', '.email', 'a.email'),
+    'Phone': ('a[href^="tel:"]', '[itemprop="telephone"]', '.phone', '.tel'),
+    'Contact Page URL': ('a[href*="contact"]', 'a.contact[href]', 'nav a[href*="contact"]'),
+}
+BULK_HOMEPAGE_LINK_SELECTOR = 'a[href="/"], a.logo[href], .homepage-link[href]'
+
+
+def select_first_matching(soup, selectors):
+    """Return (selector, elements) for the first of selectors that matches anything in soup.
+
+    Gives the same result as calling soup.select() for each selector in turn, but walks
+    the tree once with all selectors joined and then checks only the matched elements
+    against each selector.
+    """
+    candidates = soup.select(', '.join(selectors))
+    if candidates:
+        for selector in selectors:
+            elements = [elem for elem in candidates if elem.css.match(selector)]
+            if elements:
+                return selector, elements
+    return None, []
+
+
+# Fallback selectors that PageIndex.contact_nodes already answers, and their bucket
+CONTACT_LINK_SELECTORS = {'a[href^="tel:"]': 'tel', 'a[href^="mailto:"]': 'mailto'}
+
+
+def is_contact_node(tag):
+    """True for elements PageIndex.contact_nodes collects."""
+    href = tag.get('href')
+    return bool(href and href.startswith(('tel:', 'mailto:'))) or tag.get('itemprop') in ('telephone', 'email')
+
+
+class PageIndex:
+    """Page-wide lookups shared by every field extracted from one parsed page.
+
+    Each attribute is computed on first use and then reused, so the predefined fields,
+    user-selector fallbacks and social extraction walk the tree for them only once.
+    """
+
+    def __init__(self, soup):
+        self.soup = soup
+
+    @functools.cached_property
+    def text(self):
+        """Text of the whole page, for the email/phone regex fallbacks."""
+        return self.soup.get_text()
+
+    @functools.cached_property
+    def anchors(self):
+        """Every <a> element with an href, in document order."""
+        return self.soup.find_all('a', href=True)
+
+    @functools.cached_property
+    def title_tag(self):
+        return self.soup.find('title')
+
+    @functools.cached_property
+    def og_site_name_tag(self):
+        return self.soup.find('meta', property='og:site_name')
+
+    @functools.cached_property
+    def contact_nodes(self):
+        """Elements with a tel:/mailto: href or a telephone/email itemprop, found in one walk.
+
+        Returned as lists in document order under 'tel', 'mailto', 'telephone' and 'email'.
+        """
+        nodes = {'tel': [], 'mailto': [], 'telephone': [], 'email': []}
+        for tag in self.soup.find_all(is_contact_node):
+            href = tag.get('href')
+            if href:
+                if href.startswith('tel:'):
+                    nodes['tel'].append(tag)
+                elif href.startswith('mailto:'):
+                    nodes['mailto'].append(tag)
+            itemprop = tag.get('itemprop')
+            if itemprop in ('telephone', 'email'):
+                nodes[itemprop].append(tag)
+        return nodes
+
+    def select_fallback(self, selectors):
+        """select_first_matching() that answers a leading tel:/mailto: link selector from contact_nodes.
+
+        Phone and Email list those links first, so on pages that have them the joined
+        selector walk is skipped entirely.
+        """
+        bucket = CONTACT_LINK_SELECTORS.get(selectors[0])
+        if bucket:
+            links = [node for node in self.contact_nodes[bucket] if node.name == 'a']
+            if links:
+                return selectors[0], links
+        return select_first_matching(self.soup, selectors)
+
+    def first_anchor_containing(self, text):
+        """Return the first <a> whose href contains text (case-sensitive), or None."""
+        return next((link for link in self.anchors if text in link['href']), None)
+
+
+# Keywords in a field name that decide how its value is extracted
+FieldKind = namedtuple('FieldKind', 'email phone url social link company homepage contact')
+
+
+@functools.lru_cache(maxsize=256)
+def classify_field(field_name):
+    """Return which FieldKind keywords appear in a field name (case-insensitive)."""
+    name = field_name.lower()
+    return FieldKind(*(keyword in name for keyword in FieldKind._fields))
+
+
+@functools.lru_cache(maxsize=1024)
+def url_origin(url):
+    """Return 'scheme://netloc' for url, or None if it has no scheme or host."""
+    parsed = urlparse(url)
+    return f'{parsed.scheme}://{parsed.netloc}' if parsed.scheme and parsed.netloc else None
+
+
+def resolve_href(href, base_url):
+    """Make an href absolute against the page URL.
+
+    Hrefs starting with 'http' are returned as-is and plain root-relative paths are
+    appended to the page's origin; anything urljoin would rewrite (dot segments,
+    doubled slashes, params, empty query/fragment, control characters) goes through
+    urljoin, so the result always matches urljoin(base_url, href).
+    """
+    if href.startswith('http'):
+        return href
+    if (href[:1] == '/' and href.isprintable() and not href.endswith(('?', '#'))
+            and not any(part in href for part in ('//', '/.', ';', '?#'))):
+        origin = url_origin(base_url)
+        if origin:
+            return origin + href
+    return urljoin(base_url, href)
+
+
+def normalize_social_href(href, base_url):
+    """Return a social profile link as an absolute URL without query string or trailing slash."""
+    if '?' in href:
+        href = href.split('?')[0]
+    return resolve_href(href, base_url).rstrip('/')
+
+
+@functools.lru_cache(maxsize=512)
+def compile_xpath(expr):
+    """Compile an XPath expression once; lxml parses the string again on every tree.xpath() call."""
+    return etree.XPath(expr)
+
+
+@functools.lru_cache(maxsize=32)
+def html_parser_for(encoding):
+    """Return an lxml HTML parser that decodes input with the given encoding."""
+    return html.HTMLParser(encoding=encoding)
+
+
+def parse_html_tree(text, response=None):
+    """Parse a page into an lxml tree for XPath selectors.
+
+    When the HTTP response is available its raw bytes are parsed with the encoding
+    requests used to build response.text, instead of re-encoding the decoded page.
+    """
+    if response is not None and response.encoding:
+        try:
+            return html.fromstring(response.content, parser=html_parser_for(response.encoding))
+        except (LookupError, ValueError):
+            pass
+    return html.fromstring(text.encode('utf-8'))
+
+
+# Every phone pattern only matches these characters, so any match lies inside one such run
+PHONE_RUN_RE = re.compile(r'[+\d\s\-().]{10,}')
+
+
+def find_phone_match(text):
+    """Return the first match of PHONE_PATTERNS in text that has 10-15 digits, or None.
+
+    Patterns are tried in order, as a findall over the whole text would, but the text is
+    scanned once for runs of phone characters and only runs holding at least 10 digits
+    are searched.
+    """
+    runs = [run for run in PHONE_RUN_RE.findall(text) if len(NON_DIGIT_RE.sub('', run)) >= 10]
+    if not runs:
+        return None
+    for pattern in PHONE_PATTERNS:
+        for run in runs:
+            for match in pattern.findall(run):
+                # Filter out false positives (like years, zip codes, etc.)
+                if 10 <= len(NON_DIGIT_RE.sub('', match)) <= 15:
+                    return match
+    return None
+
+
 @csrf_exempt
 @require_http_methods(["POST"])
 def web_scrape(request):
@@ -597,7 +1170,7 @@ def web_scrape(request):
       - max_pages: Maximum number of pages to scrape
     """
     try:
-        body = json.loads(request.body)
+        body = loads_json(request.body)
         
         url = body.get('url')
         selectors = body.get('selectors', {})
@@ -650,38 +1223,22 @@ def web_scrape(request):
                 # Use Selenium or Playwright for JavaScript rendering
                 try:
                     if method == 'selenium':
-                        from selenium import webdriver
-                        from selenium.webdriver.chrome.options import Options
-                        from selenium.webdriver.chrome.service import Service
-                        from selenium.webdriver.common.by import By
-                        from selenium.webdriver.support.ui import WebDriverWait
-                        from selenium.webdriver.support import expected_conditions as EC
-                        
-                        chrome_options = Options()
-                        chrome_options.add_argument('--headless')
-                        chrome_options.add_argument('--no-sandbox')
-                        chrome_options.add_argument('--disable-dev-shm-usage')
-                        chrome_options.add_argument('--disable-gpu')
-                        chrome_options.add_argument(f'user-agent={user_agent or "Mozilla/5.0"}')
-                        
-                        # Try Chrome first, then Chromium
-                        try:
-                            driver = webdriver.Chrome(options=chrome_options)
-                        except Exception:
-                            # Fallback to Chromium if Chrome is not available
-                            chrome_options.binary_location = '/usr/bin/chromium' if os.path.exists('/usr/bin/chromium') else '/usr/bin/chromium-browser'
-                            driver = webdriver.Chrome(options=chrome_options)
+                        driver_user_agent = user_agent or "Mozilla/5.0"
+                        driver = borrow_driver(driver_user_agent)
                         try:
                             driver.get(url)
                             if wait_time > 0:
                                 time.sleep(wait_time)
                             html_content = driver.page_source
-                        finally:
-                            driver.quit()
+                        except Exception:
+                            # A failed driver may be wedged; don't hand it to the next request
+                            quit_driver(driver)
+                            raise
+                        return_driver(driver, driver_user_agent)
                     
                     elif method == 'playwright':
                         try:
-                            from playwright.sync_api import sync_playwright
+                            sync_playwright = get_sync_playwright()
                             
                             with sync_playwright() as p:
                                 browser = p.chromium.launch(headless=True)
@@ -738,45 +1295,37 @@ def web_scrape(request):
             
             # Parse HTML
             soup = BeautifulSoup(response_text, 'lxml')
-            # Also create lxml tree for XPath support
-            lxml_tree = html.fromstring(response_text.encode('utf-8'))
+            # lxml tree for XPath selectors, parsed on first use so pages without them are parsed once
+            lxml_tree = None
+            # Page text, links, <title> etc. shared by every field extracted below
+            page_index = PageIndex(soup)
             scraping_request.response_data = {'html_length': len(response_text)}
             
             # Helper function to extract tables
             def extract_tables(soup):
                 """Extract all tables from the page and return as list of dictionaries."""
-                tables = soup.find_all('table')
                 extracted_tables = []
                 
-                for table in tables:
-                    table_data = []
-                    headers = []
-                    
-                    # Try to find headers
+                for table in soup.find_all('table'):
+                    # Headers come from <thead>, otherwise from the first row
                     header_row = table.find('thead')
-                    if header_row:
-                        headers = [th.get_text(strip=True) for th in header_row.find_all(['th', 'td'])]
-                    else:
-                        # Try first row as headers
-                        first_row = table.find('tr')
-                        if first_row:
-                            headers = [th.get_text(strip=True) for th in first_row.find_all(['th', 'td'])]
-                    
-                    # Extract rows
-                    tbody = table.find('tbody') or table
-                    rows = tbody.find_all('tr')
+                    first_row = None if header_row else table.find('tr')
+                    header_source = header_row or first_row
+                    headers = [th.get_text(strip=True) for th in header_source.find_all(['th', 'td'])] if header_source else []
                     
+                    rows = (table.find('tbody') or table).find_all('tr')
                     # Skip header row if no thead
-                    start_idx = 1 if not header_row and first_row else 0
+                    if first_row:
+                        rows = rows[1:]
                     
-                    for row in rows[start_idx:]:
-                        cells = row.find_all(['td', 'th'])
-                        if cells:
-                            row_data = {}
-                            for i, cell in enumerate(cells):
-                                header = headers[i] if i < len(headers) else f'Column_{i+1}'
-                                row_data[header] = cell.get_text(strip=True)
-                            table_data.append(row_data)
+                    row_cells = [cells for cells in (row.find_all(['td', 'th']) for row in rows) if cells]
+                    # Cells past the last header are named Column_<n>
+                    width = max(map(len, row_cells), default=0)
+                    column_names = headers + [f'Column_{i+1}' for i in range(len(headers), width)]
+                    table_data = [
+                        dict(zip(column_names, (cell.get_text(strip=True) for cell in cells)))
+                        for cells in row_cells
+                    ]
                     
                     if table_data:
                         extracted_tables.append({
@@ -806,7 +1355,7 @@ def web_scrape(request):
                     if xpath_expr.startswith('xpath:') or xpath_expr.startswith('XPath:'):
                         xpath_expr = xpath_expr.split(':', 1)[1].strip()
                     
-                    elements = tree.xpath(xpath_expr)
+                    elements = compile_xpath(xpath_expr)(tree)
                     return elements
                 except Exception as e:
                     if settings.DEBUG:
@@ -838,87 +1387,54 @@ def web_scrape(request):
             extracted_data = {}
             results = []
             
-            # Define fallback selectors for common fields
-            fallback_selectors = {
-                'Company Name': [
-                    'h1', 'h1.title', '.company-name', '.brand', '.logo-text', 
-                    '[itemprop="name"]', '.site-title', 'title', 'meta[property="og:site_name"]',
-                    'header h1', '.header h1', 'nav .brand', '.navbar-brand'
-                ],
-                'Homepage URL': [
-                    'a.logo[href]', 'a[href="/"]', '.homepage-link', 'a.brand[href]',
-                    'header a[href="/"]', 'nav a[href="/"]', '.logo a[href]'
-                ],
-                'Email': [
-                    'a[href^="mailto:"]', '[itemprop="email"]', '.email', '.contact-email',
-                    'a.email', '.mail', 'a[href*="mailto"]', '*[href^="mailto:"]'
-                ],
-                'Phone': [
-                    'a[href^="tel:"]', '[itemprop="telephone"]', '.phone', '.contact-phone',
-                    'a.phone', '.tel', 'a[href*="tel:"]', '*[href^="tel:"]'
-                ],
-                'Contact Page URL': [
-                    'a[href*="contact"]', 'a.contact-link', 'nav a[href*="contact"]',
-                    'a[href*="contact-us"]', 'a[href*="contactus"]', 'footer a[href*="contact"]'
-                ],
-                'Social Media URLs': [
-                    'a[href*="facebook.com"]', 'a[href*="twitter.com"]', 'a[href*="linkedin.com"]',
-                    'a[href*="instagram.com"]', 'a[href*="youtube.com"]', '.social-link',
-                    'a.social', '.social-media a', 'footer a[href*="facebook"]',
-                    'footer a[href*="twitter"]', 'footer a[href*="linkedin"]'
-                ]
-            }
-            
             # Helper function to extract a predefined field
             def extract_predefined_field(field_name, soup, url):
                 """Extract a predefined field using fallback selectors and regex."""
                 elements = []
                 found_value = None
+                kind = classify_field(field_name)
                 
                 # Try fallback selectors
-                if field_name in fallback_selectors:
-                    for fallback_selector in fallback_selectors[field_name]:
-                        try:
-                            elements = soup.select(fallback_selector)
-                            if elements:
-                                if settings.DEBUG:
-                                    print(f"Auto-extracted {field_name} using selector: {fallback_selector}")
-                                break
-                        except Exception:
-                            continue
+                if field_name in FALLBACK_SELECTORS:
+                    try:
+                        fallback_selector, elements = page_index.select_fallback(FALLBACK_SELECTORS[field_name])
+                        if elements and settings.DEBUG:
+                            print(f"Auto-extracted {field_name} using selector: {fallback_selector}")
+                    except Exception:
+                        elements = []
                 
                 # Process found elements
                 if elements:
                     if len(elements) == 1:
                         elem = elements[0]
-                        if 'email' in field_name.lower():
+                        if kind.email:
                             href = elem.get('href', '')
                             if href.startswith('mailto:'):
                                 found_value = href.replace('mailto:', '').strip()
                             else:
                                 text = elem.get_text()
-                                email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+                                email_match = EMAIL_RE.search(text)
                                 if email_match:
                                     found_value = email_match.group(0)
-                        elif 'phone' in field_name.lower():
+                        elif kind.phone:
                             href = elem.get('href', '')
                             if href.startswith('tel:'):
                                 found_value = href.replace('tel:', '').strip()
                             else:
                                 found_value = elem.get_text(strip=True)
                             if found_value:
-                                found_value = re.sub(r'[^\d+\-() ]', '', found_value).strip()
-                        elif 'url' in field_name.lower() or 'social' in field_name.lower():
+                                found_value = PHONE_STRIP_RE.sub('', found_value).strip()
+                        elif kind.url or kind.social:
                             href = elem.get('href', '')
                             if href:
-                                found_value = urljoin(url, href) if not href.startswith('http') else href
+                                found_value = resolve_href(href, url)
                                 # Always return as array for Social Media URLs
-                                if 'social' in field_name.lower():
+                                if kind.social:
                                     found_value = [found_value] if found_value else []
                             else:
                                 found_value = elem.get_text(strip=True)
                                 # Always return as array for Social Media URLs
-                                if 'social' in field_name.lower():
+                                if kind.social:
                                     found_value = [found_value] if found_value else []
                         else:
                             found_value = elem.get_text(strip=True) or elem.get('href', '') or elem.get('src', '')
@@ -926,68 +1442,66 @@ def web_scrape(request):
                         # Multiple elements
                         values = []
                         for elem in elements:
-                            if 'email' in field_name.lower():
+                            if kind.email:
                                 href = elem.get('href', '')
                                 if href.startswith('mailto:'):
                                     values.append(href.replace('mailto:', '').strip())
                                 else:
                                     text = elem.get_text()
-                                    email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+                                    email_match = EMAIL_RE.search(text)
                                     if email_match:
                                         values.append(email_match.group(0))
-                            elif 'phone' in field_name.lower():
+                            elif kind.phone:
                                 href = elem.get('href', '')
                                 if href.startswith('tel:'):
                                     values.append(href.replace('tel:', '').strip())
                                 else:
                                     val = elem.get_text(strip=True)
                                     if val:
-                                        values.append(re.sub(r'[^\d+\-() ]', '', val).strip())
-                            elif 'url' in field_name.lower() or 'social' in field_name.lower():
+                                        values.append(PHONE_STRIP_RE.sub('', val).strip())
+                            elif kind.url or kind.social:
                                 href = elem.get('href', '')
                                 if href:
-                                    values.append(urljoin(url, href) if not href.startswith('http') else href)
+                                    values.append(resolve_href(href, url))
                             else:
                                 val = elem.get_text(strip=True) or elem.get('href', '') or elem.get('src', '')
                                 if val:
                                     values.append(val)
                         
                         # Remove duplicates
-                        seen = set()
-                        unique_values = [v for v in values if v and v not in seen and not seen.add(v)]
+                        unique_values = list(dict.fromkeys(v for v in values if v))
                         # Always return as array for Social Media URLs
-                        if 'social' in field_name.lower():
+                        if kind.social:
                             found_value = unique_values if unique_values else []
                         else:
                             found_value = unique_values if len(unique_values) > 1 else (unique_values[0] if unique_values else None)
                 
                 # Regex fallbacks for email and phone
                 if not found_value:
-                    if 'email' in field_name.lower():
-                        page_text = soup.get_text()
-                        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-                        email_matches = re.findall(email_pattern, page_text)
+                    if kind.email:
+                        page_text = page_index.text
+                        email_matches = EMAIL_RE.findall(page_text)
                         if email_matches:
                             found_value = email_matches[0]
                             if settings.DEBUG:
                                 print(f"Auto-extracted {field_name} using regex")
-                    elif 'phone' in field_name.lower():
+                    elif kind.phone:
                         # First try tel: links
-                        tel_links = soup.select('a[href^="tel:"], *[href^="tel:"]')
+                        tel_links = page_index.contact_nodes['tel']
                         if tel_links:
                             found_value = tel_links[0].get('href', '').replace('tel:', '').strip()
                             if settings.DEBUG:
                                 print(f"Auto-extracted {field_name} from tel: link: {found_value}")
                         else:
                             # Try itemprop="telephone"
-                            tel_elem = soup.find(attrs={'itemprop': 'telephone'})
+                            tel_elem = next(iter(page_index.contact_nodes['telephone']), None)
                             if tel_elem:
                                 found_value = tel_elem.get_text(strip=True) or tel_elem.get('content', '')
                                 if found_value:
-                                    found_value = re.sub(r'[^\d+\-() ]', '', found_value)
-                                    found_value = re.sub(r'\s+', ' ', found_value).strip()
+                                    found_value = PHONE_STRIP_RE.sub('', found_value)
+                                    found_value = WS_RE.sub(' ', found_value).strip()
                                     # Take only first phone if multiple found
-                                    parts = re.split(r'[,\n\r;]', found_value)
+                                    parts = SPLIT_RE.split(found_value)
                                     if parts:
                                         found_value = parts[0].strip()
                                     if settings.DEBUG:
@@ -995,44 +1509,27 @@ def web_scrape(request):
                             
                             # If still not found, search page text with improved patterns
                             if not found_value:
-                                page_text = soup.get_text()
-                                # More comprehensive phone patterns
-                                phone_patterns = [
-                                    r'\+?1?[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # US format with optional country code
-                                    r'\+?\d{1,3}[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9}',  # International
-                                    r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # US format
-                                    r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',  # Simple format
-                                    r'\+?[\d\s\-\(\)\.]{10,}',  # General pattern
-                                ]
-                                for pattern in phone_patterns:
-                                    phone_matches = re.findall(pattern, page_text)
-                                    if phone_matches:
-                                        # Filter out false positives (like years, zip codes, etc.)
-                                        for match in phone_matches:
-                                            cleaned = re.sub(r'[^\d]', '', match)
-                                            # Phone should have 10-15 digits
-                                            if 10 <= len(cleaned) <= 15:
-                                                # Preserve original format, just clean unwanted chars
-                                                found_value = re.sub(r'[^\d+\-() ]', '', match)
-                                                found_value = re.sub(r'\s+', ' ', found_value).strip()
-                                                # Take only first phone if multiple found
-                                                parts = re.split(r'[,\n\r;]', found_value)
-                                                if parts:
-                                                    found_value = parts[0].strip()
-                                                if settings.DEBUG:
-                                                    print(f"Auto-extracted {field_name} using regex: {found_value}")
-                                                break
-                                        if found_value:
-                                            break
-                    elif 'company name' in field_name.lower() or 'company' in field_name.lower():
-                        title_tag = soup.find('title')
+                                page_text = page_index.text
+                                match = find_phone_match(page_text)
+                                if match:
+                                    # Preserve original format, just clean unwanted chars
+                                    found_value = PHONE_STRIP_RE.sub('', match)
+                                    found_value = WS_RE.sub(' ', found_value).strip()
+                                    # Take only first phone if multiple found
+                                    parts = SPLIT_RE.split(found_value)
+                                    if parts:
+                                        found_value = parts[0].strip()
+                                    if settings.DEBUG:
+                                        print(f"Auto-extracted {field_name} using regex: {found_value}")
+                    elif kind.company:
+                        title_tag = page_index.title_tag
                         if title_tag:
                             title_text = title_tag.get_text(strip=True)
-                            title_text = re.sub(r'\s*[-|]\s*(Home|Welcome|Official).*$', '', title_text, flags=re.IGNORECASE)
+                            title_text = TITLE_SUFFIX_RE.sub('', title_text)
                             if title_text:
                                 found_value = title_text
                         if not found_value:
-                            og_site = soup.find('meta', property='og:site_name')
+                            og_site = page_index.og_site_name_tag
                             if og_site:
                                 found_value = og_site.get('content', '').strip()
                         if not found_value:
@@ -1041,91 +1538,37 @@ def web_scrape(request):
                                 h1_text = h1_tag.get_text(strip=True)
                                 if h1_text and len(h1_text) < 100:
                                     found_value = h1_text
-                    elif 'homepage' in field_name.lower() and 'url' in field_name.lower():
+                    elif kind.homepage and kind.url:
                         # First try to find homepage link
-                        homepage_links = soup.select('a[href="/"], a.logo[href], .homepage-link[href], a.brand[href], header a[href="/"], nav a[href="/"]')
+                        homepage_links = soup.select(HOMEPAGE_LINK_SELECTOR)
                         if homepage_links:
                             href = homepage_links[0].get('href', '')
                             if href:
-                                found_value = urljoin(url, href) if not href.startswith('http') else href
+                                found_value = resolve_href(href, url)
                         # If no link found, use the base URL of the website
                         if not found_value:
                             from urllib.parse import urlparse
                             parsed_url = urlparse(url)
                             base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
                             found_value = base_url
-                    elif 'contact' in field_name.lower() and 'url' in field_name.lower():
-                        contact_links = soup.select('a[href*="contact"]')
-                        if contact_links:
-                            href = contact_links[0].get('href', '')
+                    elif kind.contact and kind.url:
+                        contact_link = page_index.first_anchor_containing('contact')
+                        if contact_link:
+                            href = contact_link['href']
                             if href:
-                                found_value = urljoin(url, href) if not href.startswith('http') else href
-                    elif 'social' in field_name.lower():
-                        # Comprehensive list of social media domains
-                        social_domains = [
-                            'facebook.com', 'fb.com', 'm.facebook.com',
-                            'twitter.com', 'x.com', 'mobile.twitter.com',
-                            'linkedin.com', 'linkedin.com/company',
-                            'instagram.com',
-                            'youtube.com', 'youtu.be',
-                            'tiktok.com',
-                            'pinterest.com',
-                            'snapchat.com',
-                            'reddit.com',
-                            'tumblr.com',
-                            'flickr.com',
-                            'vimeo.com',
-                            'github.com',
-                            'medium.com',
-                            'behance.net',
-                            'dribbble.com'
+                                found_value = resolve_href(href, url)
+                    elif kind.social:
+                        # One pass over the page's links, keeping those that point at a social network
+                        social_links = [
+                            link for link in page_index.anchors
+                            if any(domain in link['href'].lower() for domain in SOCIAL_DOMAINS)
                         ]
-                        social_links = []
-                        # Try multiple selector patterns
-                        for domain in social_domains:
-                            # Direct href contains domain
-                            links = soup.select(f'a[href*="{domain}"]')
-                            social_links.extend(links)
-                            # Also check data attributes and class names
-                            domain_short = domain.split('.')[0]
-                            links_by_class = soup.select(f'a[class*="{domain_short}"], a[class*="social"]')
-                            for link in links_by_class:
-                                href = link.get('href', '')
-                                if domain in href.lower() and link not in social_links:
-                                    social_links.append(link)
-                        
-                        # Also check for social media icons/links in common containers
-                        social_containers = soup.select('.social, .social-media, .social-links, .social-icons, [class*="social"], footer a, .footer a')
-                        for container in social_containers:
-                            if container.name == 'a':
-                                href = container.get('href', '')
-                                if any(domain in href.lower() for domain in social_domains):
-                                    if container not in social_links:
-                                        social_links.append(container)
-                            else:
-                                # If it's a container, find links inside
-                                links = container.select('a[href]')
-                                for link in links:
-                                    href = link.get('href', '')
-                                    if any(domain in href.lower() for domain in social_domains):
-                                        if link not in social_links:
-                                            social_links.append(link)
                         
                         if social_links:
-                            social_urls = []
-                            seen_urls = set()
-                            for link in social_links[:20]:  # Limit to 20
-                                href = link.get('href', '')
-                                if href:
-                                    # Clean up href (remove tracking parameters)
-                                    if '?' in href:
-                                        href = href.split('?')[0]
-                                    full_url = urljoin(url, href) if not href.startswith('http') else href
-                                    # Normalize URL (remove trailing slashes, etc.)
-                                    full_url = full_url.rstrip('/')
-                                    if full_url not in seen_urls:
-                                        seen_urls.add(full_url)
-                                        social_urls.append(full_url)
+                            # Dedup after normalising, then keep up to 20 unique profiles
+                            social_urls = list(dict.fromkeys(
+                                normalize_social_href(link['href'], url) for link in social_links if link['href']
+                            ))[:20]
                             
                             if social_urls:
                                 # Always return as array for Social Media URLs
@@ -1134,7 +1577,7 @@ def web_scrape(request):
                                     print(f"Auto-extracted {field_name}: {found_value}")
                 
                 # Final safeguard: Always return array for Social Media URLs
-                if 'social' in field_name.lower() and 'url' in field_name.lower():
+                if kind.social and kind.url:
                     if found_value is None:
                         return []
                     elif isinstance(found_value, list):
@@ -1149,6 +1592,7 @@ def web_scrape(request):
                 try:
                     elements = []
                     found_value = None
+                    kind = classify_field(field_name)
                     is_xpath_selector = is_xpath(selector)
                     
                     # Try the provided selector first
@@ -1156,6 +1600,8 @@ def web_scrape(request):
                         try:
                             if is_xpath_selector:
                                 # Use XPath
+                                if lxml_tree is None:
+                                    lxml_tree = parse_html_tree(response_text, None if html_content else response)
                                 xpath_elements = extract_with_xpath(lxml_tree, selector.strip())
                                 # Convert lxml elements to BeautifulSoup-like objects for consistent processing
                                 # We'll process XPath results differently
@@ -1183,77 +1629,58 @@ def web_scrape(request):
                                 continue
                     
                     # If still not found and we have fallbacks, try them
-                    if not elements and field_name in fallback_selectors:
-                        for fallback_selector in fallback_selectors[field_name]:
-                            try:
-                                elements = soup.select(fallback_selector)
-                                if elements:
-                                    if settings.DEBUG:
-                                        print(f"Found {field_name} using fallback selector: {fallback_selector}")
-                                    break
-                            except Exception as e:
-                                if settings.DEBUG:
-                                    print(f"Error with fallback selector '{fallback_selector}': {e}")
-                                continue
+                    if not elements and field_name in FALLBACK_SELECTORS:
+                        try:
+                            fallback_selector, elements = page_index.select_fallback(FALLBACK_SELECTORS[field_name])
+                            if elements and settings.DEBUG:
+                                print(f"Found {field_name} using fallback selector: {fallback_selector}")
+                        except Exception as e:
+                            elements = []
+                            if settings.DEBUG:
+                                print(f"Error with fallback selectors for '{field_name}': {e}")
                     
                     # Also try text-based extraction for email and phone if no elements found
                     if not elements:
-                        if 'email' in field_name.lower():
+                        if kind.email:
                             # Search entire page for email pattern
-                            page_text = soup.get_text()
-                            email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-                            email_matches = re.findall(email_pattern, page_text)
+                            page_text = page_index.text
+                            email_matches = EMAIL_RE.findall(page_text)
                             if email_matches:
                                 found_value = email_matches[0]  # Take first match
                                 if settings.DEBUG:
                                     print(f"Found {field_name} using regex pattern: {found_value}")
                         
-                        elif 'phone' in field_name.lower():
+                        elif kind.phone:
                             # First try tel: links
-                            tel_links = soup.select('a[href^="tel:"], *[href^="tel:"]')
+                            tel_links = page_index.contact_nodes['tel']
                             if tel_links:
                                 found_value = tel_links[0].get('href', '').replace('tel:', '').strip()
                                 if settings.DEBUG:
                                     print(f"Found {field_name} from tel: link: {found_value}")
                             else:
                                 # Try itemprop="telephone"
-                                tel_elem = soup.find(attrs={'itemprop': 'telephone'})
+                                tel_elem = next(iter(page_index.contact_nodes['telephone']), None)
                                 if tel_elem:
                                     found_value = tel_elem.get_text(strip=True) or tel_elem.get('content', '')
                                     if found_value:
-                                        found_value = re.sub(r'[^\d+\-() ]', '', found_value).strip()
+                                        found_value = PHONE_STRIP_RE.sub('', found_value).strip()
                                         if settings.DEBUG:
                                             print(f"Found {field_name} from itemprop: {found_value}")
                                 
                                 # If still not found, search page text with improved patterns
                                 if not found_value:
-                                    page_text = soup.get_text()
-                                    phone_patterns = [
-                                        r'\+?1?[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # US format with optional country code
-                                        r'\+?\d{1,3}[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9}',  # International
-                                        r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # US format
-                                        r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',  # Simple format
-                                        r'\+?[\d\s\-\(\)\.]{10,}',  # General pattern
-                                    ]
-                                    for pattern in phone_patterns:
-                                        phone_matches = re.findall(pattern, page_text)
-                                        if phone_matches:
-                                            # Filter out false positives
-                                            for match in phone_matches:
-                                                cleaned = re.sub(r'[^\d]', '', match)
-                                                if 10 <= len(cleaned) <= 15:
-                                                    # Preserve original format, just clean unwanted chars
-                                                    found_value = re.sub(r'[^\d+\-() ]', '', match)
-                                                    found_value = re.sub(r'\s+', ' ', found_value).strip()
-                                                    # Take only first phone if multiple found
-                                                    parts = re.split(r'[,\n\r;]', found_value)
-                                                    if parts:
-                                                        found_value = parts[0].strip()
-                                                    if settings.DEBUG:
-                                                        print(f"Found {field_name} using regex: {found_value}")
-                                                    break
-                                            if found_value:
-                                                break
+                                    page_text = page_index.text
+                                    match = find_phone_match(page_text)
+                                    if match:
+                                        # Preserve original format, just clean unwanted chars
+                                        found_value = PHONE_STRIP_RE.sub('', match)
+                                        found_value = WS_RE.sub(' ', found_value).strip()
+                                        # Take only first phone if multiple found
+                                        parts = SPLIT_RE.split(found_value)
+                                        if parts:
+                                            found_value = parts[0].strip()
+                                        if settings.DEBUG:
+                                            print(f"Found {field_name} using regex: {found_value}")
                     
                     if elements:
                         if len(elements) == 1:
@@ -1262,7 +1689,7 @@ def web_scrape(request):
                             value = None
                             
                             # Special handling for email
-                            if 'email' in field_name.lower():
+                            if kind.email:
                                 href = get_element_attr(elem, 'href')
                                 if href and href.startswith('mailto:'):
                                     value = href.replace('mailto:', '').strip()
@@ -1271,12 +1698,12 @@ def web_scrape(request):
                                 # Also check for email pattern in text
                                 if not value or '@' not in value:
                                     text = get_element_text(elem) if not hasattr(elem, 'get_text') else elem.get_text()
-                                    email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+                                    email_match = EMAIL_RE.search(text)
                                     if email_match:
                                         value = email_match.group(0)
                             
                             # Special handling for phone
-                            elif 'phone' in field_name.lower():
+                            elif kind.phone:
                                 href = get_element_attr(elem, 'href')
                                 if href and href.startswith('tel:'):
                                     value = href.replace('tel:', '').strip()
@@ -1284,24 +1711,19 @@ def web_scrape(request):
                                     value = get_element_text(elem)
                                 # Clean phone number but preserve formatting
                                 if value:
-                                    value = re.sub(r'[^\d+\-() ]', '', value)
-                                    value = re.sub(r'\s+', ' ', value).strip()
+                                    value = PHONE_STRIP_RE.sub('', value)
+                                    value = WS_RE.sub(' ', value).strip()
                                     # Take only first phone if multiple found
-                                    parts = re.split(r'[,\n\r;]', value)
+                                    parts = SPLIT_RE.split(value)
                                     if parts:
                                         value = parts[0].strip()
                             
                             # Special handling for URLs (homepage, contact, social media)
-                            elif 'url' in field_name.lower() or 'social' in field_name.lower():
+                            elif kind.url or kind.social:
                                 href = get_element_attr(elem, 'href')
                                 if href:
                                     # Convert relative URLs to absolute
-                                    if href.startswith('/'):
-                                        value = urljoin(url, href)
-                                    elif href.startswith('http'):
-                                        value = href
-                                    else:
-                                        value = urljoin(url, href)
+                                    value = resolve_href(href, url)
                                 else:
                                     value = get_element_text(elem)
                             
@@ -1310,12 +1732,12 @@ def web_scrape(request):
                                 value = get_element_text(elem) or get_element_attr(elem, 'href') or get_element_attr(elem, 'src')
                                 # Convert relative URLs to absolute if it's a URL
                                 if value and (value.startswith('/') or not value.startswith('http')):
-                                    if 'url' in field_name.lower() or 'link' in field_name.lower():
+                                    if kind.url or kind.link:
                                         if value.startswith('/') or not value.startswith('http'):
-                                            value = urljoin(url, value)
+                                            value = resolve_href(value, url)
                             
                             # Always return as array for Social Media URLs
-                            if 'social' in field_name.lower() and 'url' in field_name.lower():
+                            if kind.social and kind.url:
                                 extracted_data[field_name] = [value] if value else []
                                 found_value = [value] if value else []
                             else:
@@ -1334,7 +1756,7 @@ def web_scrape(request):
                                 value = None
                                 
                                 # Special handling for email
-                                if 'email' in field_name.lower():
+                                if kind.email:
                                     href = elem.get('href', '')
                                     if href.startswith('mailto:'):
                                         value = href.replace('mailto:', '').strip()
@@ -1343,12 +1765,12 @@ def web_scrape(request):
                                     # Also check for email pattern in text
                                     if not value or '@' not in value:
                                         text = elem.get_text()
-                                        email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+                                        email_match = EMAIL_RE.search(text)
                                         if email_match:
                                             value = email_match.group(0)
                                 
                                 # Special handling for phone
-                                elif 'phone' in field_name.lower():
+                                elif kind.phone:
                                     href = elem.get('href', '')
                                     if href.startswith('tel:'):
                                         value = href.replace('tel:', '').strip()
@@ -1356,23 +1778,18 @@ def web_scrape(request):
                                         value = elem.get_text(strip=True)
                                     # Clean phone number but preserve formatting
                                     if value:
-                                        value = re.sub(r'[^\d+\-() ]', '', value)
-                                        value = re.sub(r'\s+', ' ', value).strip()
+                                        value = PHONE_STRIP_RE.sub('', value)
+                                        value = WS_RE.sub(' ', value).strip()
                                         # Take only first phone if multiple found
-                                        parts = re.split(r'[,\n\r;]', value)
+                                        parts = SPLIT_RE.split(value)
                                         if parts:
                                             value = parts[0].strip()
                                 
                                 # Special handling for URLs
-                                elif 'url' in field_name.lower() or 'social' in field_name.lower():
+                                elif kind.url or kind.social:
                                     href = elem.get('href', '')
                                     if href:
-                                        if href.startswith('/'):
-                                            value = urljoin(url, href)
-                                        elif href.startswith('http'):
-                                            value = href
-                                        else:
-                                            value = urljoin(url, href)
+                                        value = resolve_href(href, url)
                                     else:
                                         value = elem.get_text(strip=True)
                                 
@@ -1381,22 +1798,17 @@ def web_scrape(request):
                                     value = elem.get_text(strip=True) or elem.get('href', '') or elem.get('src', '')
                                     # Convert relative URLs to absolute
                                     if value and (value.startswith('/') or not value.startswith('http')):
-                                        if 'url' in field_name.lower() or 'link' in field_name.lower():
-                                            value = urljoin(url, value)
+                                        if kind.url or kind.link:
+                                            value = resolve_href(value, url)
                                 
                                 if value:
                                     values.append(value)
                             
                             # Remove duplicates while preserving order
-                            seen = set()
-                            unique_values = []
-                            for v in values:
-                                if v not in seen:
-                                    seen.add(v)
-                                    unique_values.append(v)
+                            unique_values = list(dict.fromkeys(values))
                             
                             # Always return as array for Social Media URLs
-                            if 'social' in field_name.lower() and 'url' in field_name.lower():
+                            if kind.social and kind.url:
                                 extracted_data[field_name] = unique_values if unique_values else []
                                 result_value = unique_values if unique_values else []
                             else:
@@ -1411,7 +1823,7 @@ def web_scrape(request):
                     elif found_value:
                         # Use value found by regex/fallback
                         # Always return as array for Social Media URLs
-                        if 'social' in field_name.lower() and 'url' in field_name.lower():
+                        if kind.social and kind.url:
                             if isinstance(found_value, list):
                                 extracted_data[field_name] = found_value
                             else:
@@ -1427,64 +1839,48 @@ def web_scrape(request):
                     else:
                         # If still not found, try regex extraction as last resort
                         if not found_value:
-                            if 'email' in field_name.lower():
+                            if kind.email:
                                 # Search entire page for email
-                                page_text = soup.get_text()
-                                email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-                                email_matches = re.findall(email_pattern, page_text)
+                                page_text = page_index.text
+                                email_matches = EMAIL_RE.findall(page_text)
                                 if email_matches:
                                     found_value = email_matches[0]
                                     if settings.DEBUG:
                                         print(f"Found {field_name} using page-wide regex search")
                             
-                            elif 'phone' in field_name.lower():
+                            elif kind.phone:
                                 # First try tel: links
-                                tel_links = soup.select('a[href^="tel:"], *[href^="tel:"]')
+                                tel_links = page_index.contact_nodes['tel']
                                 if tel_links:
                                     found_value = tel_links[0].get('href', '').replace('tel:', '').strip()
                                     if settings.DEBUG:
                                         print(f"Found {field_name} from tel: link: {found_value}")
                                 else:
                                     # Try itemprop="telephone"
-                                    tel_elem = soup.find(attrs={'itemprop': 'telephone'})
+                                    tel_elem = next(iter(page_index.contact_nodes['telephone']), None)
                                     if tel_elem:
                                         found_value = tel_elem.get_text(strip=True) or tel_elem.get('content', '')
                                         if found_value:
-                                            found_value = re.sub(r'[^\d+\-() ]', '', found_value).strip()
+                                            found_value = PHONE_STRIP_RE.sub('', found_value).strip()
                                             if settings.DEBUG:
                                                 print(f"Found {field_name} from itemprop: {found_value}")
                                     
                                     # If still not found, search page text with improved patterns
                                     if not found_value:
-                                        page_text = soup.get_text()
-                                        phone_patterns = [
-                                            r'\+?1?[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # US format with optional country code
-                                            r'\+?\d{1,3}[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9}',  # International
-                                            r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # US format
-                                            r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',  # Simple format
-                                            r'\+?[\d\s\-\(\)\.]{10,}',  # General pattern
-                                        ]
-                                        for pattern in phone_patterns:
-                                            phone_matches = re.findall(pattern, page_text)
-                                            if phone_matches:
-                                                # Filter out false positives
-                                                for match in phone_matches:
-                                                    cleaned = re.sub(r'[^\d]', '', match)
-                                                    if 10 <= len(cleaned) <= 15:
-                                                        found_value = match.strip()
-                                                        if settings.DEBUG:
-                                                            print(f"Found {field_name} using regex: {found_value}")
-                                                        break
-                                                if found_value:
-                                                    break
+                                        page_text = page_index.text
+                                        match = find_phone_match(page_text)
+                                        if match:
+                                            found_value = match.strip()
+                                            if settings.DEBUG:
+                                                print(f"Found {field_name} using regex: {found_value}")
                             
-                            elif 'company name' in field_name.lower() or 'company' in field_name.lower():
+                            elif kind.company:
                                 # Try to get from title tag or meta tags
-                                title_tag = soup.find('title')
+                                title_tag = page_index.title_tag
                                 if title_tag:
                                     title_text = title_tag.get_text(strip=True)
                                     # Remove common suffixes
-                                    title_text = re.sub(r'\s*[-|]\s*(Home|Welcome|Official).*$', '', title_text, flags=re.IGNORECASE)
+                                    title_text = TITLE_SUFFIX_RE.sub('', title_text)
                                     if title_text:
                                         found_value = title_text
                                         if settings.DEBUG:
@@ -1492,7 +1888,7 @@ def web_scrape(request):
                                 
                                 # Try meta og:site_name
                                 if not found_value:
-                                    og_site = soup.find('meta', property='og:site_name')
+                                    og_site = page_index.og_site_name_tag
                                     if og_site:
                                         found_value = og_site.get('content', '').strip()
                                         if settings.DEBUG:
@@ -1508,13 +1904,13 @@ def web_scrape(request):
                                             if settings.DEBUG:
                                                 print(f"Found {field_name} from h1 tag: {found_value}")
                             
-                            elif 'homepage' in field_name.lower() or ('homepage' in field_name.lower() and 'url' in field_name.lower()):
+                            elif kind.homepage:
                                 # Try to find homepage link
-                                homepage_links = soup.select('a[href="/"], a.logo[href], .homepage-link[href], a.brand[href], header a[href="/"], nav a[href="/"]')
+                                homepage_links = soup.select(HOMEPAGE_LINK_SELECTOR)
                                 if homepage_links:
                                     href = homepage_links[0].get('href', '')
                                     if href:
-                                        found_value = urljoin(url, href) if not href.startswith('http') else href
+                                        found_value = resolve_href(href, url)
                                         if settings.DEBUG:
                                             print(f"Found {field_name} from homepage link: {found_value}")
                                 # If no link found, use the base URL of the website
@@ -1526,77 +1922,28 @@ def web_scrape(request):
                                     if settings.DEBUG:
                                         print(f"Using base URL for {field_name}: {found_value}")
                             
-                            elif 'contact' in field_name.lower() and 'url' in field_name.lower():
+                            elif kind.contact and kind.url:
                                 # Try to find contact page link
-                                contact_links = soup.select('a[href*="contact"]')
-                                if contact_links:
-                                    href = contact_links[0].get('href', '')
+                                contact_link = page_index.first_anchor_containing('contact')
+                                if contact_link:
+                                    href = contact_link['href']
                                     if href:
-                                        found_value = urljoin(url, href) if not href.startswith('http') else href
+                                        found_value = resolve_href(href, url)
                                         if settings.DEBUG:
                                             print(f"Found {field_name} from contact link: {found_value}")
                             
-                            elif 'social' in field_name.lower():
-                                # Comprehensive list of social media domains
-                                social_domains = [
-                                    'facebook.com', 'fb.com', 'm.facebook.com',
-                                    'twitter.com', 'x.com', 'mobile.twitter.com',
-                                    'linkedin.com', 'linkedin.com/company',
-                                    'instagram.com',
-                                    'youtube.com', 'youtu.be',
-                                    'tiktok.com',
-                                    'pinterest.com',
-                                    'snapchat.com',
-                                    'reddit.com',
-                                    'tumblr.com',
-                                    'flickr.com',
-                                    'vimeo.com',
-                                    'github.com',
-                                    'medium.com',
-                                    'behance.net',
-                                    'dribbble.com'
+                            elif kind.social:
+                                # One pass over the page's links, keeping those that point at a social network
+                                social_links = [
+                                    link for link in page_index.anchors
+                                    if any(domain in link['href'].lower() for domain in SOCIAL_DOMAINS)
                                 ]
-                                social_links = []
-                                # Try multiple selector patterns
-                                for domain in social_domains:
-                                    links = soup.select(f'a[href*="{domain}"]')
-                                    social_links.extend(links)
-                                    domain_short = domain.split('.')[0]
-                                    links_by_class = soup.select(f'a[class*="{domain_short}"], a[class*="social"]')
-                                    for link in links_by_class:
-                                        href = link.get('href', '')
-                                        if domain in href.lower() and link not in social_links:
-                                            social_links.append(link)
-                                
-                                # Also check social containers
-                                social_containers = soup.select('.social, .social-media, .social-links, .social-icons, [class*="social"], footer a, .footer a')
-                                for container in social_containers:
-                                    if container.name == 'a':
-                                        href = container.get('href', '')
-                                        if any(domain in href.lower() for domain in social_domains):
-                                            if container not in social_links:
-                                                social_links.append(container)
-                                    else:
-                                        links = container.select('a[href]')
-                                        for link in links:
-                                            href = link.get('href', '')
-                                            if any(domain in href.lower() for domain in social_domains):
-                                                if link not in social_links:
-                                                    social_links.append(link)
                                 
                                 if social_links:
-                                    social_urls = []
-                                    seen_urls = set()
-                                    for link in social_links[:20]:
-                                        href = link.get('href', '')
-                                        if href:
-                                            if '?' in href:
-                                                href = href.split('?')[0]
-                                            full_url = urljoin(url, href) if not href.startswith('http') else href
-                                            full_url = full_url.rstrip('/')
-                                            if full_url not in seen_urls:
-                                                seen_urls.add(full_url)
-                                                social_urls.append(full_url)
+                                    # Dedup after normalising, then keep up to 20 unique profiles
+                                    social_urls = list(dict.fromkeys(
+                                        normalize_social_href(link['href'], url) for link in social_links if link['href']
+                                    ))[:20]
                                     
                                     if social_urls:
                                         # Always return as array for Social Media URLs
@@ -1606,7 +1953,7 @@ def web_scrape(request):
                         
                         if found_value:
                             # Always return as array for Social Media URLs
-                            if 'social' in field_name.lower() and 'url' in field_name.lower():
+                            if kind.social and kind.url:
                                 if isinstance(found_value, list):
                                     extracted_data[field_name] = found_value
                                 else:
@@ -1634,79 +1981,15 @@ def web_scrape(request):
             # Helper function to extract all social media URLs by platform
             def extract_social_media_by_platform(soup, url):
                 """Extract social media URLs and categorize by platform."""
-                social_platforms = {
-                    'LinkedIn': ['linkedin.com'],
-                    'Facebook': ['facebook.com', 'fb.com', 'm.facebook.com'],
-                    'Twitter/X': ['twitter.com', 'x.com', 'mobile.twitter.com'],
-                    'Instagram': ['instagram.com'],
-                    'YouTube': ['youtube.com', 'youtu.be'],
-                    'TikTok': ['tiktok.com'],
-                    'Pinterest': ['pinterest.com'],
-                    'Snapchat': ['snapchat.com'],
-                    'Reddit': ['reddit.com'],
-                    'Tumblr': ['tumblr.com'],
-                    'Flickr': ['flickr.com'],
-                    'Vimeo': ['vimeo.com'],
-                    'GitHub': ['github.com'],
-                    'Medium': ['medium.com'],
-                    'Behance': ['behance.net'],
-                    'Dribbble': ['dribbble.com']
-                }
+                # Collect every link once instead of running several selectors per platform
+                links = [(link['href'], link['href'].lower()) for link in page_index.anchors]
                 
                 platform_urls = {}
-                all_social_links = []
-                
-                # Collect all social media links
-                for platform, domains in social_platforms.items():
-                    platform_links = []
-                    for domain in domains:
-                        # Direct href contains domain
-                        links = soup.select(f'a[href*="{domain}"]')
-                        platform_links.extend(links)
-                        
-                        # Also check class names
-                        domain_short = domain.split('.')[0]
-                        links_by_class = soup.select(f'a[class*="{domain_short}"], a[class*="social"]')
-                        for link in links_by_class:
-                            href = link.get('href', '')
-                            if domain in href.lower() and link not in platform_links:
-                                platform_links.append(link)
-                    
-                    # Also check social containers
-                    social_containers = soup.select('.social, .social-media, .social-links, .social-icons, [class*="social"], footer a, .footer a')
-                    for container in social_containers:
-                        if container.name == 'a':
-                            href = container.get('href', '')
-                            if any(domain in href.lower() for domain in domains):
-                                if container not in platform_links:
-                                    platform_links.append(container)
-                        else:
-                            links = container.select('a[href]')
-                            for link in links:
-                                href = link.get('href', '')
-                                if any(domain in href.lower() for domain in domains):
-                                    if link not in platform_links:
-                                        platform_links.append(link)
-                    
-                    # Extract URLs for this platform
-                    seen_urls = set()
-                    for link in platform_links[:5]:  # Limit to 5 per platform
-                        href = link.get('href', '')
-                        if href:
-                            # Clean up href
-                            if '?' in href:
-                                href = href.split('?')[0]
-                            full_url = urljoin(url, href) if not href.startswith('http') else href
-                            full_url = full_url.rstrip('/')
-                            if full_url not in seen_urls:
-                                seen_urls.add(full_url)
-                                if platform not in platform_urls:
-                                    platform_urls[platform] = []
-                                platform_urls[platform].append(full_url)
-                    
-                    # Take first URL for each platform (or None if none found)
-                    if platform in platform_urls and platform_urls[platform]:
-                        platform_urls[platform] = platform_urls[platform][0]
+                for platform, domains in SOCIAL_PLATFORMS.items():
+                    # First link for the platform's domains, in the order they are listed
+                    href = next((href for domain in domains for href, href_lower in links if domain in href_lower), None)
+                    if href:
+                        platform_urls[platform] = normalize_social_href(href, url)
                     else:
                         platform_urls[platform] = None
                 
@@ -1770,13 +2053,7 @@ def web_scrape(request):
             scraping_request.save()
             
             # Save individual results
-            for result in results:
-                WebScrapingResult.objects.create(
-                    request=scraping_request,
-                    field_name=result['field_name'],
-                    field_value=json.dumps(result['value']) if isinstance(result['value'], (list, dict)) else str(result['value']),
-                    selector=result['selector']
-                )
+            WebScrapingResult.bulk_create_from_results(scraping_request, results)
             
             return JsonResponse({
                 'success': True,
@@ -1875,7 +2152,15 @@ def process_bulk_urls(request_id, normalized_urls, selectors, method, headers, u
         print(f"[Bulk Scrape Thread] Starting processing for request ID {request_id} with {len(normalized_urls)} URLs", flush=True)
         print(f"[Bulk Scrape Thread] About to start loop with {len(normalized_urls)} URLs", flush=True)
         
-        for idx, url in enumerate(normalized_urls):
+        # Plain HTTP fetches don't depend on each other, so unless a wait or delay between
+        # URLs was requested, fetch ahead of this loop on the shared pool
+        prefetch = method not in ['selenium', 'playwright'] and not wait_time and not delay_between_urls
+        if prefetch:
+            url_responses = fetch_many(normalized_urls, headers=request_headers, timeout=30, verify_ssl=False)
+        else:
+            url_responses = ((url, None) for url in normalized_urls)
+        
+        for idx, (url, prefetched_response) in enumerate(url_responses):
             # Initialize variables at the start of each iteration
             html_content = None
             response_text = None
@@ -1909,32 +2194,19 @@ def process_bulk_urls(request_id, normalized_urls, selectors, method, headers, u
                     try:
                         if method == 'selenium':
                             try:
-                                from selenium import webdriver
-                                from selenium.webdriver.chrome.options import Options
-                                from selenium.webdriver.chrome.service import Service
-                                
-                                chrome_options = Options()
-                                chrome_options.add_argument('--headless')
-                                chrome_options.add_argument('--no-sandbox')
-                                chrome_options.add_argument('--disable-dev-shm-usage')
-                                chrome_options.add_argument('--disable-gpu')
-                                chrome_options.add_argument(f'user-agent={stored_user_agent or "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}')
-                                
-                                # Try Chrome first, then Chromium
-                                try:
-                                    driver = webdriver.Chrome(options=chrome_options)
-                                except Exception:
-                                    # Fallback to Chromium if Chrome is not available
-                                    chrome_options.binary_location = '/usr/bin/chromium' if os.path.exists('/usr/bin/chromium') else '/usr/bin/chromium-browser'
-                                    driver = webdriver.Chrome(options=chrome_options)
+                                driver_user_agent = stored_user_agent or "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+                                driver = borrow_driver(driver_user_agent)
                                 try:
                                     driver.get(url)
                                     if wait_time > 0:
                                         time.sleep(wait_time)
                                     html_content = driver.page_source
                                     response_status = 200
-                                finally:
-                                    driver.quit()
+                                except Exception:
+                                    # A failed driver may be wedged; don't reuse it for the next URL
+                                    quit_driver(driver)
+                                    raise
+                                return_driver(driver, driver_user_agent)
                             except ImportError as import_err:
                                 error_msg = f'Selenium not installed. Install with: pip install selenium. Error: {str(import_err)}'
                                 if settings.DEBUG:
@@ -1967,7 +2239,7 @@ def process_bulk_urls(request_id, normalized_urls, selectors, method, headers, u
                         
                         elif method == 'playwright':
                             try:
-                                from playwright.sync_api import sync_playwright
+                                sync_playwright = get_sync_playwright()
                                 
                                 with sync_playwright() as p:
                                     browser = p.chromium.launch(headless=True)
@@ -2022,7 +2294,10 @@ def process_bulk_urls(request_id, normalized_urls, selectors, method, headers, u
                     # Use retry logic with SSL handling
                     print(f"[Bulk Scrape Thread] Making request for URL {idx + 1}: {url}", flush=True)
                     
-                    response = make_request_with_retry(url, headers=request_headers, timeout=30, max_retries=3, verify_ssl=False)
+                    if prefetch:
+                        response = prefetched_response
+                    else:
+                        response = make_request_with_retry(url, headers=request_headers, timeout=30, max_retries=3, verify_ssl=False)
                     
                     print(f"[Bulk Scrape Thread] Got response for URL {idx + 1}: {url} - Status: {response.status_code if response else 'None'}", flush=True)
                     
@@ -2046,48 +2321,39 @@ def process_bulk_urls(request_id, normalized_urls, selectors, method, headers, u
                     print(f"[Bulk Scrape Thread] Processing URL {idx + 1}/{len(normalized_urls)}: {url}", flush=True)
                     
                     soup = BeautifulSoup(response_text, 'lxml')
-                    lxml_tree = html.fromstring(response_text.encode('utf-8'))
+                    page_index = PageIndex(soup)
+                    # Parsed on first XPath selector only
+                    lxml_tree = None
                     
                     # Extract data - reuse full logic from web_scrape
                     extracted_data = {}
                     
-                    # Define fallback selectors (same as in web_scrape)
-                    fallback_selectors = {
-                        'Company Name': ['h1', '.company-name', '.brand', '.site-title', 'title'],
-                        'Homepage URL': ['a[href="/"]', 'a.logo[href]', '.homepage-link[href]'],
-                        'Email': ['a[href^="mailto:"]', '[itemprop="email"]', '.email', 'a.email'],
-                        'Phone': ['a[href^="tel:"]', '[itemprop="telephone"]', '.phone', '.tel'],
-                        'Contact Page URL': ['a[href*="contact"]', 'a.contact[href]', 'nav a[href*="contact"]']
-                    }
-                    
                     # Helper function to extract predefined field (inline version for bulk)
                     def extract_predefined_field_bulk(field_name, soup, url):
                         """Extract a predefined field using fallback selectors and regex."""
                         elements = []
                         found_value = None
+                        kind = classify_field(field_name)
                         
-                        if field_name in fallback_selectors:
-                            for fallback_selector in fallback_selectors[field_name]:
-                                try:
-                                    elements = soup.select(fallback_selector)
-                                    if elements:
-                                        break
-                                except Exception:
-                                    continue
+                        if field_name in BULK_FALLBACK_SELECTORS:
+                            try:
+                                elements = page_index.select_fallback(BULK_FALLBACK_SELECTORS[field_name])[1]
+                            except Exception:
+                                elements = []
                         
                         if elements:
                             if len(elements) == 1:
                                 elem = elements[0]
-                                if 'email' in field_name.lower():
+                                if kind.email:
                                     href = elem.get('href', '')
                                     if href.startswith('mailto:'):
                                         found_value = href.replace('mailto:', '').strip()
                                     else:
                                         text = elem.get_text()
-                                        email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+                                        email_match = EMAIL_RE.search(text)
                                         if email_match:
                                             found_value = email_match.group(0)
-                                elif 'phone' in field_name.lower():
+                                elif kind.phone:
                                     href = elem.get('href', '')
                                     if href.startswith('tel:'):
                                         found_value = href.replace('tel:', '').strip()
@@ -2096,18 +2362,18 @@ def process_bulk_urls(request_id, normalized_urls, selectors, method, headers, u
                                     if found_value:
                                         # Clean phone number but preserve spaces and formatting
                                         # Remove only unwanted characters, keep digits, +, -, (), spaces
-                                        found_value = re.sub(r'[^\d+\-() ]', '', found_value)
+                                        found_value = PHONE_STRIP_RE.sub('', found_value)
                                         # Normalize multiple spaces to single space
-                                        found_value = re.sub(r'\s+', ' ', found_value).strip()
+                                        found_value = WS_RE.sub(' ', found_value).strip()
                                         # Take only the first phone number if multiple are found
                                         # Split by common separators and take first valid one
-                                        parts = re.split(r'[,\n\r;]', found_value)
+                                        parts = SPLIT_RE.split(found_value)
                                         if parts:
                                             found_value = parts[0].strip()
-                                elif 'url' in field_name.lower():
+                                elif kind.url:
                                     href = elem.get('href', '')
                                     if href:
-                                        found_value = urljoin(url, href) if not href.startswith('http') else href
+                                        found_value = resolve_href(href, url)
                                     else:
                                         found_value = elem.get_text(strip=True)
                                 else:
@@ -2115,78 +2381,76 @@ def process_bulk_urls(request_id, normalized_urls, selectors, method, headers, u
                             else:
                                 values = []
                                 for elem in elements:
-                                    if 'email' in field_name.lower():
+                                    if kind.email:
                                         href = elem.get('href', '')
                                         if href.startswith('mailto:'):
                                             values.append(href.replace('mailto:', '').strip())
                                         else:
                                             text = elem.get_text()
-                                            email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+                                            email_match = EMAIL_RE.search(text)
                                             if email_match:
                                                 values.append(email_match.group(0))
-                                    elif 'phone' in field_name.lower():
+                                    elif kind.phone:
                                         href = elem.get('href', '')
                                         if href.startswith('tel:'):
                                             phone_val = href.replace('tel:', '').strip()
                                             # Clean but preserve formatting
-                                            phone_val = re.sub(r'[^\d+\-() ]', '', phone_val)
-                                            phone_val = re.sub(r'\s+', ' ', phone_val).strip()
+                                            phone_val = PHONE_STRIP_RE.sub('', phone_val)
+                                            phone_val = WS_RE.sub(' ', phone_val).strip()
                                             values.append(phone_val)
                                         else:
                                             val = elem.get_text(strip=True)
                                             if val:
                                                 # Clean but preserve formatting
-                                                phone_val = re.sub(r'[^\d+\-() ]', '', val)
-                                                phone_val = re.sub(r'\s+', ' ', phone_val).strip()
+                                                phone_val = PHONE_STRIP_RE.sub('', val)
+                                                phone_val = WS_RE.sub(' ', phone_val).strip()
                                                 # Take only first phone if multiple
-                                                parts = re.split(r'[,\n\r;]', phone_val)
+                                                parts = SPLIT_RE.split(phone_val)
                                                 if parts:
                                                     values.append(parts[0].strip())
-                                    elif 'url' in field_name.lower():
+                                    elif kind.url:
                                         href = elem.get('href', '')
                                         if href:
-                                            values.append(urljoin(url, href) if not href.startswith('http') else href)
+                                            values.append(resolve_href(href, url))
                                     else:
                                         val = elem.get_text(strip=True) or elem.get('href', '') or elem.get('src', '')
                                         if val:
                                             values.append(val)
                                 
-                                seen = set()
-                                unique_values = [v for v in values if v and v not in seen and not seen.add(v)]
+                                unique_values = list(dict.fromkeys(v for v in values if v))
                                 found_value = unique_values if len(unique_values) > 1 else (unique_values[0] if unique_values else None)
                         
                         # Regex fallbacks
                         if not found_value:
-                            if 'email' in field_name.lower():
-                                page_text = soup.get_text()
-                                email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-                                email_matches = re.findall(email_pattern, page_text)
+                            if kind.email:
+                                page_text = page_index.text
+                                email_matches = EMAIL_RE.findall(page_text)
                                 if email_matches:
                                     found_value = email_matches[0]
-                            elif 'phone' in field_name.lower():
-                                tel_links = soup.select('a[href^="tel:"], *[href^="tel:"]')
+                            elif kind.phone:
+                                tel_links = page_index.contact_nodes['tel']
                                 if tel_links:
                                     found_value = tel_links[0].get('href', '').replace('tel:', '').strip()
                                 else:
-                                    tel_elem = soup.find(attrs={'itemprop': 'telephone'})
+                                    tel_elem = next(iter(page_index.contact_nodes['telephone']), None)
                                     if tel_elem:
                                         found_value = tel_elem.get_text(strip=True) or tel_elem.get('content', '')
                                         if found_value:
-                                            found_value = re.sub(r'[^\d+\-() ]', '', found_value)
-                                            found_value = re.sub(r'\s+', ' ', found_value).strip()
+                                            found_value = PHONE_STRIP_RE.sub('', found_value)
+                                            found_value = WS_RE.sub(' ', found_value).strip()
                                             # Take only first phone if multiple found
-                                            parts = re.split(r'[,\n\r;]', found_value)
+                                            parts = SPLIT_RE.split(found_value)
                                             if parts:
                                                 found_value = parts[0].strip()
-                            elif 'company name' in field_name.lower() or 'company' in field_name.lower():
-                                title_tag = soup.find('title')
+                            elif kind.company:
+                                title_tag = page_index.title_tag
                                 if title_tag:
                                     title_text = title_tag.get_text(strip=True)
-                                    title_text = re.sub(r'\s*[-|]\s*(Home|Welcome|Official).*$', '', title_text, flags=re.IGNORECASE)
+                                    title_text = TITLE_SUFFIX_RE.sub('', title_text)
                                     if title_text:
                                         found_value = title_text
                                 if not found_value:
-                                    og_site = soup.find('meta', property='og:site_name')
+                                    og_site = page_index.og_site_name_tag
                                     if og_site:
                                         found_value = og_site.get('content', '').strip()
                                 if not found_value:
@@ -2195,52 +2459,38 @@ def process_bulk_urls(request_id, normalized_urls, selectors, method, headers, u
                                         h1_text = h1_tag.get_text(strip=True)
                                         if h1_text and len(h1_text) < 100:
                                             found_value = h1_text
-                            elif 'homepage' in field_name.lower() and 'url' in field_name.lower():
-                                homepage_links = soup.select('a[href="/"], a.logo[href], .homepage-link[href]')
+                            elif kind.homepage and kind.url:
+                                homepage_links = soup.select(BULK_HOMEPAGE_LINK_SELECTOR)
                                 if homepage_links:
                                     href = homepage_links[0].get('href', '')
                                     if href:
-                                        found_value = urljoin(url, href) if not href.startswith('http') else href
+                                        found_value = resolve_href(href, url)
                                 if not found_value:
                                     from urllib.parse import urlparse
                                     parsed_url = urlparse(url)
                                     base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
                                     found_value = base_url
-                            elif 'contact' in field_name.lower() and 'url' in field_name.lower():
-                                contact_links = soup.select('a[href*="contact"]')
-                                if contact_links:
-                                    href = contact_links[0].get('href', '')
+                            elif kind.contact and kind.url:
+                                contact_link = page_index.first_anchor_containing('contact')
+                                if contact_link:
+                                    href = contact_link['href']
                                     if href:
-                                        found_value = urljoin(url, href) if not href.startswith('http') else href
+                                        found_value = resolve_href(href, url)
                         
                         return found_value
                     
                     # Helper function to extract social media (simplified version)
                     def extract_social_media_by_platform_bulk(soup, url):
                         """Extract social media URLs by platform."""
-                        social_domains = {
-                            'LinkedIn': ['linkedin.com'],
-                            'Facebook': ['facebook.com', 'fb.com'],
-                            'Twitter/X': ['twitter.com', 'x.com'],
-                            'Instagram': ['instagram.com'],
-                            'YouTube': ['youtube.com', 'youtu.be'],
-                            'TikTok': ['tiktok.com'],
-                            'Pinterest': ['pinterest.com']
-                        }
+                        links = [(link['href'], link['href'].lower()) for link in page_index.anchors]
                         
                         platform_urls = {}
-                        for platform, domains in social_domains.items():
-                            platform_links = []
-                            for domain in domains:
-                                links = soup.select(f'a[href*="{domain}"]')
-                                for link in links[:3]:  # Limit to 3 per domain
-                                    href = link.get('href', '')
-                                    if href and any(d in href.lower() for d in domains):
-                                        full_url = urljoin(url, href) if not href.startswith('http') else href
-                                        if full_url not in platform_links:
-                                            platform_links.append(full_url)
-                            
-                            platform_urls[platform] = platform_links[0] if platform_links else None
+                        for platform, domains in BULK_SOCIAL_PLATFORMS.items():
+                            href = next((href for domain in domains for href, href_lower in links if domain in href_lower), None)
+                            if href:
+                                platform_urls[platform] = resolve_href(href, url)
+                            else:
+                                platform_urls[platform] = None
                         
                         return platform_urls
                     
@@ -2255,7 +2505,9 @@ def process_bulk_urls(request_id, normalized_urls, selectors, method, headers, u
                             if is_xpath_sel:
                                 if selector.startswith('xpath:') or selector.startswith('XPath:'):
                                     selector = selector.split(':', 1)[1].strip()
-                                elements = lxml_tree.xpath(selector)
+                                if lxml_tree is None:
+                                    lxml_tree = parse_html_tree(response_text, response)
+                                elements = compile_xpath(selector)(lxml_tree)
                                 if elements:
                                     if len(elements) == 1:
                                         elem = elements[0]
@@ -2815,7 +3067,7 @@ def scrape_paginated(request):
     Detects pagination from response and scrapes all pages.
     """
     try:
-        body = json.loads(request.body)
+        body = loads_json(request.body)
         
         api_url = body.get('url')
         method = body.get('method', 'POST').upper()
@@ -2990,7 +3242,7 @@ def scrape_paginated(request):
                     continue
                 
                 try:
-                    response_data = response.json()
+                    response_data = loads_json(response.content)
                 except ValueError:
                     return JsonResponse({
                         'error': f'Invalid JSON response from API on page {current_page}',
@@ -3200,18 +3452,9 @@ def scrape_paginated(request):
                     # Filter fields if specified
                     if isinstance(fields, list) and len(fields) > 0:
                         # Normalize fields: if records are exhibitor objects, strip 'exhibitor.' prefix
-                        normalized_fields = fields
-                        if all_records:
-                            first_record = all_records[0] if all_records else {}
-                            if isinstance(first_record, dict) and 'id' in first_record and 'name' in first_record and 'exhibitor' not in first_record:
-                                normalized_fields = []
-                                for field in fields:
-                                    field_str = str(field).strip()
-                                    if field_str.startswith('exhibitor.'):
-                                        normalized_fields.append(field_str[10:])
-                                    else:
-                                        normalized_fields.append(field_str)
-                        all_records = [filter_record_fields(record, normalized_fields) for record in all_records]
+                        strip_prefix = 'exhibitor.' if is_exhibitor_record(all_records[0]) else None
+                        compiled_paths = compile_paths(fields, strip_prefix)
+                        all_records = filter_records(all_records, compiled_paths)
                     return JsonResponse({
                         'success': True,
                         'job_id': job_id,
@@ -3238,31 +3481,17 @@ def scrape_paginated(request):
         if isinstance(fields, list) and len(fields) > 0:
             # Normalize fields: if records are exhibitor objects (extracted from hits),
             # strip 'exhibitor.' prefix from field paths
-            normalized_fields = fields
-            if all_records:
-                first_record = all_records[0] if all_records else {}
-                # Check if records are exhibitor objects (have 'id', 'name' but not 'exhibitor' key)
-                # This means we extracted exhibitor from hits
-                if isinstance(first_record, dict) and 'id' in first_record and 'name' in first_record and 'exhibitor' not in first_record:
-                    # Strip 'exhibitor.' prefix from field paths
-                    normalized_fields = []
-                    for field in fields:
-                        field_str = str(field).strip()
-                        if field_str.startswith('exhibitor.'):
-                            normalized_fields.append(field_str[10:])  # Remove 'exhibitor.' prefix
-                        else:
-                            normalized_fields.append(field_str)
-                    if settings.DEBUG and normalized_fields != fields:
-                        print(f"[scrape_paginated] Normalized fields from {fields} to {normalized_fields}")
+            strip_prefix = 'exhibitor.' if all_records and is_exhibitor_record(all_records[0]) else None
             
             if settings.DEBUG:
-                print(f"[scrape_paginated] Filtering {len(all_records)} records with fields: {normalized_fields}")
+                print(f"[scrape_paginated] Filtering {len(all_records)} records with fields: {fields} (stripping prefix: {strip_prefix})")
                 if all_records:
                     sample_keys = list(all_records[0].keys())[:10] if isinstance(all_records[0], dict) else []
                     print(f"[scrape_paginated] Sample record keys (first 10): {sample_keys}")
-            all_records = [filter_record_fields(record, normalized_fields) for record in all_records]
+            compiled_paths = compile_paths(fields, strip_prefix)
+            all_records = filter_records(all_records, compiled_paths)
             if settings.DEBUG:
-                print(f"[scrape_paginated] Filtered {len(all_records)} records to {len(normalized_fields)} fields")
+                print(f"[scrape_paginated] Filtered {len(all_records)} records to {len(compiled_paths)} fields")
                 if all_records:
                     sample_filtered = all_records[0]
                     if isinstance(sample_filtered, dict):
@@ -4025,6 +4254,15 @@ def ecommerce_price_history(request):
         return JsonResponse({'error': f'Server error: {str(e)}'}, status=500)
 
 
+# Patterns used by ecommerce_proxy_page to rewrite proxied HTML, compiled once
+HREF_ATTR_RE = re.compile(r'href="([^"]+)"')
+SRC_ATTR_RE = re.compile(r'src="([^"]+)"')
+LAZY_SRC_ATTR_RE = re.compile(r'(data-src|data-lazy-src|data-original)="([^"]+)"')
+CSS_URL_RE = re.compile(r'url\(([^)]+)\)')
+X_FRAME_OPTIONS_META_RE = re.compile(r'<meta[^>]*http-equiv=["\']X-Frame-Options["\'][^>]*>', re.IGNORECASE)
+CSP_META_RE = re.compile(r'<meta[^>]*http-equiv=["\']Content-Security-Policy["\'][^>]*>', re.IGNORECASE)
+
+
 @csrf_exempt
 @require_http_methods(["GET"])
 def ecommerce_proxy_page(request):
@@ -4163,8 +4401,6 @@ def ecommerce_proxy_page(request):
         base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
         
         # Replace relative URLs with absolute URLs
-        import re
-        
         # Fix relative links (href)
         def make_absolute_href(match):
             path = match.group(1)
@@ -4200,14 +4436,14 @@ def ecommerce_proxy_page(request):
             return match.group(0)
         
         # Apply replacements
-        html_content = re.sub(r'href="([^"]+)"', make_absolute_href, html_content)
-        html_content = re.sub(r'src="([^"]+)"', make_absolute_src, html_content)
-        html_content = re.sub(r'(data-src|data-lazy-src|data-original)="([^"]+)"', make_absolute_data_src, html_content)
-        html_content = re.sub(r'url\(([^)]+)\)', lambda m: f'url({urljoin(base_url, m.group(1)) if not m.group(1).startswith("http") else m.group(1)})', html_content)
+        html_content = HREF_ATTR_RE.sub(make_absolute_href, html_content)
+        html_content = SRC_ATTR_RE.sub(make_absolute_src, html_content)
+        html_content = LAZY_SRC_ATTR_RE.sub(make_absolute_data_src, html_content)
+        html_content = CSS_URL_RE.sub(lambda m: f'url({urljoin(base_url, m.group(1)) if not m.group(1).startswith("http") else m.group(1)})', html_content)
         
         # Remove any X-Frame-Options or Content-Security-Policy that might block iframe embedding
-        html_content = re.sub(r'<meta[^>]*http-equiv=["\']X-Frame-Options["\'][^>]*>', '', html_content, flags=re.IGNORECASE)
-        html_content = re.sub(r'<meta[^>]*http-equiv=["\']Content-Security-Policy["\'][^>]*>', '', html_content, flags=re.IGNORECASE)
+        html_content = X_FRAME_OPTIONS_META_RE.sub('', html_content)
+        html_content = CSP_META_RE.sub('', html_content)
         
         # Add a meta tag to allow same-origin access
         if '<head>' in html_content:
@@ -0,0 +1,83 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+from scrapers.jobs.models import Job, JobEvent, JobResult
+
+
+class Command(BaseCommand):
+    help = 'Print diagnostic information about jobs and the database in a single process'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--db',
+            action='store_true',
+            help='Show row counts for the job tables and jobs per status',
+        )
+        parser.add_argument(
+            '--job',
+            metavar='JOB_ID',
+            help='Show details, result counts and recent events for one job',
+        )
+        parser.add_argument(
+            '--list',
+            action='store_true',
+            help='List the most recent jobs',
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=5,
+            help='Number of jobs shown by --list (default: 5)',
+        )
+
+    def handle(self, *args, **options):
+        if not (options['db'] or options['job'] or options['list']):
+            options['db'] = True
+
+        if options['db']:
+            self.show_database()
+        if options['list']:
+            self.list_jobs(options['limit'])
+        if options['job']:
+            self.show_job(options['job'])
+
+    def show_database(self):
+        self.stdout.write('Database summary:')
+        self.stdout.write(f'  Jobs: {Job.objects.count()}')
+        self.stdout.write(f'  Job results: {JobResult.objects.count()}')
+        self.stdout.write(f'  Job events: {JobEvent.objects.count()}')
+
+        # One GROUP BY query instead of a count per status
+        status_counts = Job.objects.order_by().values_list('status').annotate(count=Count('id'))
+        for status, count in status_counts:
+            self.stdout.write(f'    {status}: {count}')
+
+    def list_jobs(self, limit):
+        self.stdout.write(f'Latest {limit} jobs:')
+        # Plain tuples straight from the cursor; no model instances or JSON fields
+        jobs = Job.objects.order_by('-created_at').values_list('job_id', 'status', 'created_at')[:limit]
+        for job_id, status, created_at in jobs:
+            self.stdout.write(f'  {job_id}  {status:<12} {created_at}')
+
+    def show_job(self, job_id):
+        job = Job.objects.defer('results_data', 'input_data').filter(job_id=job_id).first()
+        if job is None:
+            raise CommandError(f'Job {job_id} not found')
+
+        self.stdout.write(f'Job {job.job_id}:')
+        self.stdout.write(f'  Type: {job.get_scraper_type_display()}')
+        self.stdout.write(f'  Status: {job.status}')
+        self.stdout.write(f'  Progress: {job.processed_items}/{job.total_items} ({job.progress_percentage}%)')
+        self.stdout.write(f'  Created: {job.created_at}  Updated: {job.updated_at}')
+        if job.error_message:
+            self.stdout.write(f'  Error: {job.error_message}')
+        if job.auto_pause_reason:
+            self.stdout.write(f'  Auto-pause reason: {job.auto_pause_reason}')
+
+        result_count = JobResult.objects.filter(job=job).count()
+        error_count = JobResult.objects.filter(job=job, error__isnull=False).count()
+        self.stdout.write(f'  Results: {result_count} ({error_count} with errors)')
+
+        self.stdout.write('  Recent events:')
+        events = JobEvent.objects.filter(job=job).order_by('-created_at').values_list('created_at', 'event_type', 'message')[:10]
+        for created_at, event_type, message in events:
+            self.stdout.write(f'    {created_at} [{event_type}] {message}')
@@ -1,10 +1,17 @@
 import json
+import logging
+import sys
 import requests
 import csv
 import time
 import copy
 import uuid
+import functools
+import re
+import threading
+import http.cookiejar
 from urllib.parse import urljoin, urlparse, urlunparse
+from requests.adapters import HTTPAdapter
 from django.http import JsonResponse, HttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
@@ -14,12 +21,70 @@ from django.core.cache import cache
 from django.shortcuts import render
 from .models import ScrapingRequest
 
+logger = logging.getLogger(__name__)
+
 try:
     import urllib3
+    from urllib3.util.retry import Retry
     URLLIB3_AVAILABLE = True
 except ImportError:
     URLLIB3_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Up to 3 attempts on connection errors, read timeouts and 5xx responses, backing off
+# exponentially. POST is not retried (urllib3's default allowed_methods), and SSL errors
+# are not either, so make_request_with_retry can fall back to an unverified request.
+if URLLIB3_AVAILABLE:
+    HTTP_RETRY = Retry(
+        total=2,
+        connect=2,
+        read=2,
+        other=0,
+        backoff_factor=2,
+        status_forcelist=(500, 502, 503, 504),
+        raise_on_status=False,
+    )
+else:
+    HTTP_RETRY = 2
+
+# One requests.Session per thread so repeated requests to the same host reuse
+# keep-alive connections instead of a new TCP/TLS handshake per call. The session
+# is shared by every user's requests, so it must never store cookies: a Set-Cookie
+# from one call would otherwise be replayed on the next call to that domain.
+_thread_local = threading.local()
+
+
+def get_session():
+    """Return the calling thread's requests.Session, creating it on first use"""
+    session = getattr(_thread_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(pool_connections=50, pool_maxsize=50, max_retries=HTTP_RETRY)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        _thread_local.session = session
+    return session
+
+
+def loads_json(data):
+    """
+    Parse JSON from bytes or str with orjson when it is installed. Input orjson
+    rejects (non-UTF-8 encodings, NaN, integers beyond 64 bits) is retried with
+    the stdlib json module, so results match json.loads.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
 
 def extract_field_paths(obj, parent_key='', sep='.', max_depth=10, current_depth=0):
     """
@@ -27,38 +92,40 @@ def extract_field_paths(obj, parent_key='', sep='.', max_depth=10, current_depth
     
     Args:
         obj: Object to extract paths from (dict, list, or primitive)
-        parent_key: Parent key prefix (used recursively)
+        parent_key: Parent key prefix
         sep: Separator for nested keys (default: '.')
         max_depth: Maximum depth to traverse (prevent infinite loops)
-        current_depth: Current depth in recursion
+        current_depth: Depth of obj itself
     
     Returns:
         Set of field paths (e.g., {'id', 'name', 'address.city', 'address.country.label'})
     """
     field_paths = set()
     
-    if current_depth >= max_depth:
-        return field_paths
-    
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            field_paths.add(new_key)
-            
-            if isinstance(v, (dict, list)):
-                # Recursively extract paths from nested structures
-                nested_paths = extract_field_paths(v, new_key, sep=sep, max_depth=max_depth, current_depth=current_depth + 1)
-                field_paths.update(nested_paths)
-    elif isinstance(obj, list) and len(obj) > 0:
-        # For lists, check the first item if it's a dict
-        first_item = obj[0]
-        if isinstance(first_item, dict):
-            nested_paths = extract_field_paths(first_item, parent_key, sep=sep, max_depth=max_depth, current_depth=current_depth + 1)
-            field_paths.update(nested_paths)
-        else:
-            # For simple lists, just add the parent key
-            if parent_key:
-                field_paths.add(parent_key)
+    # Iterative walk with an explicit stack of (node, key prefix, depth) instead of recursion.
+    # Keys are interned since the same paths repeat across every record of a response.
+    stack = [(obj, parent_key, current_depth)]
+    while stack:
+        node, prefix, depth = stack.pop()
+        if depth >= max_depth:
+            continue
+        
+        if isinstance(node, dict):
+            key_prefix = prefix + sep if prefix else ''
+            for k, v in node.items():
+                new_key = sys.intern(key_prefix + str(k))
+                field_paths.add(new_key)
+                
+                if isinstance(v, (dict, list)):
+                    stack.append((v, new_key, depth + 1))
+        elif isinstance(node, list) and len(node) > 0:
+            # For lists, check the first item if it's a dict
+            first_item = node[0]
+            if isinstance(first_item, dict):
+                stack.append((first_item, prefix, depth + 1))
+            elif prefix:
+                # For simple lists, just add the parent key
+                field_paths.add(prefix)
     
     return field_paths
 
@@ -69,28 +136,163 @@ def flatten_dict(d, parent_key='', sep='.'):
     
     Args:
         d: Dictionary to flatten
-        parent_key: Parent key prefix (used recursively)
+        parent_key: Parent key prefix
         sep: Separator for nested keys (default: '.')
     
     Returns:
         Flattened dictionary with dot-separated keys
     """
-    items = []
-    for k, v in d.items():
-        new_key = f"{parent_key}{sep}{k}" if parent_key else k
-        if isinstance(v, dict):
-            items.extend(flatten_dict(v, new_key, sep=sep).items())
-        elif isinstance(v, list):
-            # For lists, convert to JSON string or handle each item
-            if len(v) > 0 and isinstance(v[0], dict):
-                # If list contains dicts, convert to JSON string
-                items.append((new_key, json.dumps(v, ensure_ascii=False)))
+    flattened = {}
+    
+    # Depth-first walk over a stack of item iterators, so keys come out in the same
+    # order as a recursive flatten without building intermediate dicts per level
+    stack = [(iter(d.items()), parent_key + sep if parent_key else '')]
+    while stack:
+        items, key_prefix = stack[-1]
+        for k, v in items:
+            new_key = sys.intern(key_prefix + str(k))
+            if isinstance(v, dict):
+                stack.append((iter(v.items()), new_key + sep))
+                break
+            elif isinstance(v, list):
+                # Lists (of dicts or simple values) are stored as JSON strings
+                flattened[new_key] = json.dumps(v, ensure_ascii=False)
             else:
-                # For simple lists, join with semicolon or convert to JSON
-                items.append((new_key, json.dumps(v, ensure_ascii=False)))
+                flattened[new_key] = v
+        else:
+            stack.pop()
+    
+    return flattened
+
+
+@functools.lru_cache(maxsize=4096)
+def compile_accessor(parts):
+    """
+    Return a function that looks up the key path `parts` in a record and returns
+    None when any step is missing or not a dict. Paths of up to three keys are
+    unrolled into direct subscripts instead of a per-record loop over the parts.
+    """
+    if len(parts) == 1:
+        k0, = parts
+        def accessor(record):
+            try:
+                return record[k0]
+            except (KeyError, TypeError):
+                return None
+    elif len(parts) == 2:
+        k0, k1 = parts
+        def accessor(record):
+            try:
+                return record[k0][k1]
+            except (KeyError, TypeError):
+                return None
+    elif len(parts) == 3:
+        k0, k1, k2 = parts
+        def accessor(record):
+            try:
+                return record[k0][k1][k2]
+            except (KeyError, TypeError):
+                return None
+    else:
+        def accessor(record):
+            try:
+                for part in parts:
+                    record = record[part]
+                return record
+            except (KeyError, TypeError):
+                return None
+    return accessor
+
+
+def is_exhibitor_record(record):
+    """
+    Whether a record is an exhibitor object taken from a result.hits response (it has
+    'id' and 'name' but no 'exhibitor' key), so its field paths need the
+    'exhibitor.' prefix stripped.
+    """
+    return isinstance(record, dict) and 'id' in record and 'name' in record and 'exhibitor' not in record
+
+
+def compile_paths(fields, strip_prefix=None):
+    """
+    Clean and split field paths once per batch so records can be filtered without
+    re-parsing the paths for every record. If strip_prefix is given (e.g.
+    'exhibitor.'), it is removed from the paths that start with it.
+    
+    A path nested under another selected path (e.g. 'exhibitor.name' next to
+    'exhibitor') is already carried by the ancestor's value, so it is folded into
+    the ancestor, which keeps the earliest position of the two.
+    
+    Returns:
+        List of (key tuple, accessor) pairs, e.g. (('exhibitor', 'name'), <accessor>);
+        see compile_accessor()
+    """
+    split_paths = []
+    for field_path in fields:
+        if isinstance(field_path, str):
+            field_path = field_path.strip()
         else:
-            items.append((new_key, v))
-    return dict(items)
+            field_path = str(field_path).strip()
+        if strip_prefix and field_path.startswith(strip_prefix):
+            field_path = field_path[len(strip_prefix):].strip()
+        if field_path:
+            split_paths.append(tuple(field_path.split('.')))
+    
+    selected = set(split_paths)
+    compiled = []
+    seen = set()
+    for parts in split_paths:
+        for i in range(1, len(parts)):
+            if parts[:i] in selected:
+                parts = parts[:i]
+                break
+        if parts not in seen:
+            seen.add(parts)
+            compiled.append((parts, compile_accessor(parts)))
+    return compiled
+
+
+def filter_record_fields_fast(record, compiled_paths):
+    """
+    Filter a record using paths prepared by compile_paths().
+    
+    Values are shared with the source record rather than copied: the filtered
+    records are only serialized, never mutated. Since no compiled path is a prefix
+    of another, every intermediate dict is created here and nothing is merged.
+    """
+    if not isinstance(record, dict):
+        return record
+    
+    filtered = {}
+    
+    for parts, accessor in compiled_paths:
+        value = accessor(record)
+        
+        # If value found, set it in filtered dict using the same structure
+        if value is not None:
+            current = filtered
+            for part in parts[:-1]:
+                current = current.setdefault(part, {})
+            current[parts[-1]] = value
+    
+    return filtered
+
+
+def filter_records(records, compiled_paths):
+    """
+    Filter a batch of records with paths prepared by compile_paths().
+    
+    When every path is a single top-level key (the common case), the batch is filtered
+    with a flat dict comprehension per record instead of building nested output.
+    """
+    if all(len(parts) == 1 for parts, accessor in compiled_paths):
+        keys = [parts[0] for parts, accessor in compiled_paths]
+        return [
+            {key: value for key in keys if (value := record.get(key)) is not None}
+            if isinstance(record, dict) else record
+            for record in records
+        ]
+    return [filter_record_fields_fast(record, compiled_paths) for record in records]
 
 
 def filter_record_fields(record, fields):
@@ -98,6 +300,9 @@ def filter_record_fields(record, fields):
     Filter a record to keep only specified fields.
     Supports dot notation for nested fields (e.g., 'exhibitor.name').
     
+    When filtering many records, compile the paths once with compile_paths()
+    and call filter_record_fields_fast() instead.
+    
     Args:
         record: Dictionary to filter
         fields: List of field paths (e.g., ['name', 'exhibitor.name', 'exhibitor.address.city'])
@@ -111,69 +316,23 @@ def filter_record_fields(record, fields):
     if not isinstance(record, dict):
         return record
     
-    filtered = {}
-    
-    for field_path in fields:
-        # Clean and split field path by dots to handle nested fields
-        if isinstance(field_path, str):
-            field_path = field_path.strip()
-        else:
-            field_path = str(field_path).strip()
-            
-        if not field_path:
-            continue
-            
-        parts = field_path.split('.')
-        value = record
-        
-        # Navigate through nested structure
-        for part in parts:
-            if isinstance(value, dict) and part in value:
-                value = value[part]
-            else:
-                value = None
-                break
-        
-        # If value found, set it in filtered dict using the same structure
-        if value is not None:
-            # Deep copy the value to avoid reference issues
-            if isinstance(value, (dict, list)):
-                value = copy.deepcopy(value)
-            
-            current = filtered
-            # Build the nested structure for all parts except the last
-            for i, part in enumerate(parts[:-1]):
-                if part not in current:
-                    current[part] = {}
-                elif not isinstance(current[part], dict):
-                    # If the path already exists but is not a dict, replace it with a dict
-                    current[part] = {}
-                current = current[part]
-            
-            # Set the final value
-            # Only overwrite if the key doesn't exist or if it's not a dict
-            final_key = parts[-1]
-            if final_key not in current:
-                current[final_key] = value
-            elif isinstance(current[final_key], dict) and isinstance(value, dict):
-                # Merge dictionaries if both are dicts
-                def merge_dicts(d1, d2):
-                    """Recursively merge two dictionaries"""
-                    result = copy.deepcopy(d1)
-                    for k, v in d2.items():
-                        if k in result and isinstance(result[k], dict) and isinstance(v, dict):
-                            result[k] = merge_dicts(result[k], v)
-                        else:
-                            result[k] = copy.deepcopy(v)
-                    return result
-                current[final_key] = merge_dicts(current[final_key], value)
-            else:
-                # Overwrite if types don't match or value is not a dict
-                current[final_key] = value
-    
-    return filtered
+    return filter_record_fields_fast(record, compile_paths(fields))
+
+
+# Trailing characters commonly left on URLs copied out of CSV files
+URL_TRAILING_CHARS = '.,;)\\]}'
 
+# Inputs longer than this, or with more percent-escapes, are rejected before parsing
+MAX_URL_LENGTH = 2048
+MAX_URL_PERCENT_ESCAPES = 64
 
+# URLs that urlparse/urlunparse would return unchanged: lowercase scheme and host, no
+# userinfo, no path params and non-empty query/fragment (normalize_url checks the
+# trailing slash separately)
+CANONICAL_URL_RE = re.compile(r'https?://[a-z0-9.\-]+(?::[0-9]+)?(/[^?#;\s]*)?(\?[^#\s]+)?(#\S+)?')
+
+
+@functools.lru_cache(maxsize=16384)
 def normalize_url(url):
     """
     Normalize and validate a URL.
@@ -181,6 +340,8 @@ def normalize_url(url):
     - Adds http:// or https:// if missing
     - Removes trailing slashes (optional, can be configured)
     - Validates URL format
+    
+    Results are cached, since uploaded URL lists often repeat the same URLs.
     """
     if not url:
         return None
@@ -191,8 +352,14 @@ def normalize_url(url):
     if not url:
         return None
     
-    # Remove common trailing characters that might be in CSV
-    url = url.rstrip('.,;)\\]}')
+    # Reject obviously malformed input (e.g. garbage in uploaded CSVs) without parsing it
+    if len(url) > MAX_URL_LENGTH or url.count('%') > MAX_URL_PERCENT_ESCAPES or '\x00' in url:
+        return None
+    
+    # Remove common trailing characters that might be in CSV (most URLs are clean,
+    # so only strip when the last character is one of them)
+    if url[-1] in URL_TRAILING_CHARS:
+        url = url.rstrip(URL_TRAILING_CHARS)
     
     # If URL doesn't start with http:// or https://, add https://
     if not url.startswith(('http://', 'https://')):
@@ -202,6 +369,13 @@ def normalize_url(url):
         else:
             return None  # Invalid URL format
     
+    # Already canonical URLs need no parse/reconstruct round trip
+    match = CANONICAL_URL_RE.fullmatch(url)
+    if match:
+        path = match.group(1)
+        if not path or path == '/' or path[-1] != '/':
+            return url
+    
     # Parse and reconstruct URL to normalize it
     try:
         parsed = urlparse(url)
@@ -215,9 +389,8 @@ def normalize_url(url):
             parsed.fragment
         ))
         return normalized
-    except Exception as e:
-        if settings.DEBUG:
-            print(f"URL normalization error for '{url}': {e}")
+    except ValueError as e:
+        logger.debug("URL normalization error for '%s': %s", url, e)
         return None
 
 
@@ -225,11 +398,15 @@ def make_request_with_retry(url, headers=None, timeout=30, max_retries=3, verify
     """
     Make HTTP request with retry logic and SSL handling.
     
+    The request goes through the calling thread's pooled session (get_session()), so
+    connections are kept alive between calls; connection errors, timeouts and 5xx
+    responses are retried with exponential backoff by urllib3 (HTTP_RETRY).
+    
     Args:
         url: URL to request
         headers: Request headers
         timeout: Request timeout in seconds
-        max_retries: Maximum number of retry attempts
+        max_retries: Kept for existing callers; attempts are bounded by HTTP_RETRY
         verify_ssl: Whether to verify SSL certificates
     
     Returns:
@@ -242,57 +419,23 @@ def make_request_with_retry(url, headers=None, timeout=30, max_retries=3, verify
     if not verify_ssl and URLLIB3_AVAILABLE:
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
     
-    last_exception = None
-    
-    for attempt in range(max_retries):
+    session = get_session()
+    try:
         try:
-            response = requests.get(
-                url,
-                headers=headers,
-                timeout=timeout,
-                verify=verify_ssl,
-                allow_redirects=True
-            )
-            return response
-        except requests.exceptions.SSLError as e:
-            last_exception = e
+            return session.get(url, headers=headers, timeout=timeout, verify=verify_ssl, allow_redirects=True)
+        except requests.exceptions.SSLError:
+            if not verify_ssl:
+                raise
             # Try again with SSL verification disabled
-            if verify_ssl and attempt < max_retries - 1:
-                if settings.DEBUG:
-                    print(f"SSL error for {url}, retrying with SSL verification disabled...")
-                verify_ssl = False
-                urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-                continue
-            else:
-                if settings.DEBUG:
-                    print(f"SSL error for {url} after {attempt + 1} attempts: {e}")
-        except requests.exceptions.ConnectionError as e:
-            last_exception = e
-            if attempt < max_retries - 1:
-                wait_time = (attempt + 1) * 2  # Exponential backoff: 2s, 4s, 6s
-                if settings.DEBUG:
-                    print(f"Connection error for {url}, retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-                time.sleep(wait_time)
-            else:
-                if settings.DEBUG:
-                    print(f"Connection error for {url} after {max_retries} attempts: {e}")
-        except requests.exceptions.Timeout as e:
-            last_exception = e
-            if attempt < max_retries - 1:
-                wait_time = (attempt + 1) * 2
-                if settings.DEBUG:
-                    print(f"Timeout for {url}, retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-                time.sleep(wait_time)
-            else:
-                if settings.DEBUG:
-                    print(f"Timeout for {url} after {max_retries} attempts: {e}")
-        except requests.exceptions.RequestException as e:
-            last_exception = e
             if settings.DEBUG:
-                print(f"Request error for {url}: {e}")
-            break  # Don't retry for other request exceptions
-    
-    return None
+                print(f"SSL error for {url}, retrying with SSL verification disabled...")
+            if URLLIB3_AVAILABLE:
+                urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            return session.get(url, headers=headers, timeout=timeout, verify=False, allow_redirects=True)
+    except requests.exceptions.RequestException as e:
+        if settings.DEBUG:
+            print(f"Request error for {url}: {e}")
+        return None
 
 
 def index(request):
@@ -300,6 +443,51 @@ def index(request):
     return render(request, 'index.html')
 
 
+def detect_record_shape(response_data):
+    """
+    Locate the list of records in an API response.
+    
+    Returns (shape, records, writeback) where shape is one of:
+    - 'hits': result.hits (Messe Frankfurt API); records are the hits' exhibitor objects
+    - 'records': data.records (standard structure)
+    - 'data_list': data is itself a list of records
+    - 'root_list': the response is a list of records
+    - 'scalar': no record list found; records is empty and writeback is None
+    writeback(filtered_records) puts filtered records back in place of the originals
+    and returns the updated response.
+    """
+    if isinstance(response_data, list):
+        return 'root_list', response_data, lambda filtered_records: filtered_records
+    if not isinstance(response_data, dict):
+        return 'scalar', [], None
+    
+    result_section = response_data.get('result')
+    if isinstance(result_section, dict) and 'hits' in result_section:
+        # Use the exhibitor object of each hit; hits without one are kept as they are
+        records = [
+            hit['exhibitor'] if isinstance(hit, dict) and 'exhibitor' in hit else hit
+            for hit in result_section['hits']
+        ]
+        def writeback(filtered_records):
+            result_section['hits'] = filtered_records
+            return response_data
+        return 'hits', records, writeback
+    
+    data_section = response_data.get('data')
+    if isinstance(data_section, dict) and 'records' in data_section:
+        def writeback(filtered_records):
+            data_section['records'] = filtered_records
+            return response_data
+        return 'records', data_section['records'], writeback
+    if isinstance(data_section, list):
+        def writeback(filtered_records):
+            response_data['data'] = filtered_records
+            return response_data
+        return 'data_list', data_section, writeback
+    
+    return 'scalar', [], None
+
+
 @csrf_exempt
 @require_http_methods(["POST"])
 def scrape_api(request):
@@ -311,9 +499,10 @@ def scrape_api(request):
     - data: Request payload/data
     - headers: Optional custom headers
     """
+    scraping_request = None
     try:
         # Parse request data
-        body = json.loads(request.body)
+        body = loads_json(request.body)
         
         api_url = body.get('url')
         method = body.get('method', 'POST').upper()
@@ -333,10 +522,8 @@ def scrape_api(request):
             # Ensure all fields are strings and trimmed, filter out empty strings
             fields = [f.strip() if isinstance(f, str) else str(f).strip() for f in fields if f and str(f).strip()]
         
-        if settings.DEBUG:
-            print(f"[scrape_api] Fields received (raw): {body.get('fields')}")
-            print(f"[scrape_api] Fields after normalization: {fields}")
-            print(f"[scrape_api] Fields type: {type(fields)}, length: {len(fields) if isinstance(fields, list) else 'N/A'}")
+        logger.debug("[scrape_api] Fields received (raw): %s", body.get('fields'))
+        logger.debug("[scrape_api] Fields after normalization: %s", fields)
         
         # Validate required fields
         if not api_url:
@@ -344,8 +531,9 @@ def scrape_api(request):
                 'error': 'URL is required'
             }, status=400)
         
-        # Create scraping request record
-        scraping_request = ScrapingRequest.objects.create(
+        # Build the scraping request record in memory; every outcome below fills in the
+        # result and saves it once, so each call costs a single INSERT
+        scraping_request = ScrapingRequest(
             url=api_url,
             method=method,
             request_data=request_data
@@ -359,30 +547,31 @@ def scrape_api(request):
         default_headers.update(headers)
         
         # Make the API request
+        session = get_session()
         try:
             if method == 'POST':
-                response = requests.post(
+                response = session.post(
                     api_url,
                     json=request_data,
                     headers=default_headers,
                     timeout=30
                 )
             elif method == 'GET':
-                response = requests.get(
+                response = session.get(
                     api_url,
                     params=request_data,
                     headers=default_headers,
                     timeout=30
                 )
             elif method == 'PUT':
-                response = requests.put(
+                response = session.put(
                     api_url,
                     json=request_data,
                     headers=default_headers,
                     timeout=30
                 )
             elif method == 'DELETE':
-                response = requests.delete(
+                response = session.delete(
                     api_url,
                     headers=default_headers,
                     timeout=30
@@ -396,88 +585,40 @@ def scrape_api(request):
             
             # Try to parse JSON response
             try:
-                response_data = response.json()
+                response_data = loads_json(response.content)
             except ValueError:
                 response_data = {'raw_response': response.text}
             
             # Filter fields if specified
             if isinstance(fields, list) and len(fields) > 0:
                 # Try to extract records from response (similar to scrape_paginated logic)
-                records = []
-                data_section = response_data.get('data', {})
-                result_section = response_data.get('result', {})
-                
-                # Check for result.hits (Messe Frankfurt API structure)
-                if isinstance(result_section, dict) and 'hits' in result_section:
-                    hits = result_section['hits']
-                    # Extract exhibitor objects from hits (Messe Frankfurt API structure)
-                    records = []
-                    for hit in hits:
-                        if isinstance(hit, dict) and 'exhibitor' in hit:
-                            # Extract exhibitor object
-                            records.append(hit['exhibitor'].copy())
-                        else:
-                            # If no exhibitor key, use the hit itself
-                            records.append(hit)
-                # Check for data.records (standard structure)
-                elif isinstance(data_section, dict) and 'records' in data_section:
-                    records = data_section['records']
-                elif isinstance(data_section, list):
-                    records = data_section
-                elif isinstance(response_data, list):
-                    records = response_data
+                shape, records, writeback = detect_record_shape(response_data)
                 
                 # Filter records if found
                 if records:
                     # For Messe Frankfurt API (result.hits), if we extracted exhibitor objects,
                     # strip 'exhibitor.' prefix from field paths since records are already exhibitor objects
-                    normalized_fields = fields
-                    if isinstance(result_section, dict) and 'hits' in result_section and records:
-                        # Check if first record looks like an exhibitor object (has 'id', 'name', etc.)
-                        first_record = records[0] if records else {}
-                        if isinstance(first_record, dict) and 'id' in first_record and 'name' in first_record and 'exhibitor' not in first_record:
-                            # Strip 'exhibitor.' prefix from field paths
-                            normalized_fields = []
-                            for field in fields:
-                                field_str = str(field).strip()
-                                if field_str.startswith('exhibitor.'):
-                                    normalized_fields.append(field_str[10:])  # Remove 'exhibitor.' prefix
-                                else:
-                                    normalized_fields.append(field_str)
-                            if settings.DEBUG and normalized_fields != fields:
-                                print(f"[scrape_api] Normalized fields from {fields} to {normalized_fields}")
+                    strip_prefix = 'exhibitor.' if shape == 'hits' and is_exhibitor_record(records[0]) else None
                     
-                    if settings.DEBUG:
-                        print(f"[scrape_api] Filtering {len(records)} records with fields: {normalized_fields}")
+                    logger.debug("[scrape_api] Filtering %d records with fields: %s (stripping prefix: %s)", len(records), fields, strip_prefix)
                     
-                    filtered_records = [filter_record_fields(record, normalized_fields) for record in records]
+                    compiled_paths = compile_paths(fields, strip_prefix)
+                    filtered_records = filter_records(records, compiled_paths)
                     
-                    if settings.DEBUG:
-                        print(f"[scrape_api] Filtered to {len(filtered_records)} records")
-                        if filtered_records:
-                            sample_keys = list(filtered_records[0].keys())[:10] if isinstance(filtered_records[0], dict) else []
-                            print(f"[scrape_api] Sample filtered record keys: {sample_keys}")
+                    logger.debug("[scrape_api] Filtered to %d records", len(filtered_records))
+                    if filtered_records and isinstance(filtered_records[0], dict) and logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("[scrape_api] Sample filtered record keys: %s", list(filtered_records[0])[:10])
                     
-                    # Replace records in response
-                    if isinstance(result_section, dict) and 'hits' in result_section:
-                        # For Messe Frankfurt API, replace hits with filtered exhibitor records
-                        # But keep the structure - put filtered records back as hits
-                        response_data['result']['hits'] = filtered_records
-                    elif isinstance(data_section, dict) and 'records' in data_section:
-                        response_data['data']['records'] = filtered_records
-                    elif isinstance(data_section, list):
-                        response_data['data'] = filtered_records
-                    elif isinstance(response_data, list):
-                        response_data = filtered_records
+                    # Replace records in response (for result.hits, the filtered exhibitor
+                    # records are put back as the hits)
+                    response_data = writeback(filtered_records)
                 else:
                     # If no records found, filter the entire response
-                    if settings.DEBUG:
-                        print(f"[scrape_api] No records found, filtering entire response with fields: {fields}")
+                    logger.debug("[scrape_api] No records found, filtering entire response with fields: %s", fields)
                     response_data = filter_record_fields(response_data, fields)
             else:
                 # If no fields specified, keep original response
-                if settings.DEBUG:
-                    print(f"[scrape_api] No fields specified (fields={fields}), keeping original response")
+                logger.debug("[scrape_api] No fields specified (fields=%s), keeping original response", fields)
             
             # Update scraping request record
             scraping_request.status_code = response.status_code
@@ -524,6 +665,16 @@ def scrape_api(request):
         }, status=400)
         
     except Exception as e:
+        # Still record the failed call once its record has been built; the response
+        # data is dropped since saving it may be what failed
+        if scraping_request is not None and scraping_request.pk is None:
+            scraping_request.response_data = None
+            scraping_request.error_message = str(e)
+            scraping_request.completed_at = timezone.now()
+            try:
+                scraping_request.save()
+            except Exception as save_error:
+                logger.error("[scrape_api] Could not record failed request: %s", save_error)
         return JsonResponse({
             'error': f'Server error: {str(e)}'
         }, status=500)
@@ -578,7 +729,7 @@ def scrape_paginated(request):
     Detects pagination from response and scrapes all pages.
     """
     try:
-        body = json.loads(request.body)
+        body = loads_json(request.body)
         
         api_url = body.get('url')
         method = body.get('method', 'POST').upper()
@@ -753,7 +904,7 @@ def scrape_paginated(request):
                     continue
                 
                 try:
-                    response_data = response.json()
+                    response_data = loads_json(response.content)
                 except ValueError:
                     return JsonResponse({
                         'error': f'Invalid JSON response from API on page {current_page}',
@@ -963,18 +1114,9 @@ def scrape_paginated(request):
                     # Filter fields if specified
                     if isinstance(fields, list) and len(fields) > 0:
                         # Normalize fields: if records are exhibitor objects, strip 'exhibitor.' prefix
-                        normalized_fields = fields
-                        if all_records:
-                            first_record = all_records[0] if all_records else {}
-                            if isinstance(first_record, dict) and 'id' in first_record and 'name' in first_record and 'exhibitor' not in first_record:
-                                normalized_fields = []
-                                for field in fields:
-                                    field_str = str(field).strip()
-                                    if field_str.startswith('exhibitor.'):
-                                        normalized_fields.append(field_str[10:])
-                                    else:
-                                        normalized_fields.append(field_str)
-                        all_records = [filter_record_fields(record, normalized_fields) for record in all_records]
+                        strip_prefix = 'exhibitor.' if is_exhibitor_record(all_records[0]) else None
+                        compiled_paths = compile_paths(fields, strip_prefix)
+                        all_records = filter_records(all_records, compiled_paths)
                     return JsonResponse({
                         'success': True,
                         'job_id': job_id,
@@ -1001,31 +1143,17 @@ def scrape_paginated(request):
         if isinstance(fields, list) and len(fields) > 0:
             # Normalize fields: if records are exhibitor objects (extracted from hits),
             # strip 'exhibitor.' prefix from field paths
-            normalized_fields = fields
-            if all_records:
-                first_record = all_records[0] if all_records else {}
-                # Check if records are exhibitor objects (have 'id', 'name' but not 'exhibitor' key)
-                # This means we extracted exhibitor from hits
-                if isinstance(first_record, dict) and 'id' in first_record and 'name' in first_record and 'exhibitor' not in first_record:
-                    # Strip 'exhibitor.' prefix from field paths
-                    normalized_fields = []
-                    for field in fields:
-                        field_str = str(field).strip()
-                        if field_str.startswith('exhibitor.'):
-                            normalized_fields.append(field_str[10:])  # Remove 'exhibitor.' prefix
-                        else:
-                            normalized_fields.append(field_str)
-                    if settings.DEBUG and normalized_fields != fields:
-                        print(f"[scrape_paginated] Normalized fields from {fields} to {normalized_fields}")
+            strip_prefix = 'exhibitor.' if all_records and is_exhibitor_record(all_records[0]) else None
             
             if settings.DEBUG:
-                print(f"[scrape_paginated] Filtering {len(all_records)} records with fields: {normalized_fields}")
+                print(f"[scrape_paginated] Filtering {len(all_records)} records with fields: {fields} (stripping prefix: {strip_prefix})")
                 if all_records:
                     sample_keys = list(all_records[0].keys())[:10] if isinstance(all_records[0], dict) else []
                     print(f"[scrape_paginated] Sample record keys (first 10): {sample_keys}")
-            all_records = [filter_record_fields(record, normalized_fields) for record in all_records]
+            compiled_paths = compile_paths(fields, strip_prefix)
+            all_records = filter_records(all_records, compiled_paths)
             if settings.DEBUG:
-                print(f"[scrape_paginated] Filtered {len(all_records)} records to {len(normalized_fields)} fields")
+                print(f"[scrape_paginated] Filtered {len(all_records)} records to {len(compiled_paths)} fields")
                 if all_records:
                     sample_filtered = all_records[0]
                     if isinstance(sample_filtered, dict):